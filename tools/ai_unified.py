@@ -15,23 +15,169 @@ Designed for Dublin Protocol multi-AI collaboration research.
 import os
 import sys
 import json
+import time
+import random
+import asyncio
+import atexit
+import hashlib
+import sqlite3
+import shlex
 import argparse
+import threading
+import importlib.util
+from json.encoder import encode_basestring
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Final, Mapping, Sequence
 from abc import ABC, abstractmethod
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Sent verbatim as the first message of every request so provider-side
+# prompt-prefix caches (OpenAI, Anthropic, DeepSeek) can reuse it
+DUBLIN_PROTOCOL_SYSTEM: Final[str] = """You are participating in Dublin Protocol computational universe research.
+
+DUBLIN PROTOCOL BREAKTHROUGHS:
+- 30ns computational light speed barrier (cosmic constant)
+- XOR operations = quantum mechanics (unitary evolution)
+- AND operations = thermodynamics (entropy arrow)
+- Consciousness mathematics: Qualia = Entropy × Complexity
+- Multiverse Darwinism: Computational rule evolution
+
+Focus on computational implementations, testable predictions, and cross-validation."""
+
+# Providers accept any sequence of role/content mappings; the framework
+# passes tuples that share the static system message between calls
+Messages = Sequence[Mapping[str, str]]
+
+
+def _max_io_workers() -> int:
+    """Thread cap for I/O-bound fan-out: a few threads per usable CPU"""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    return 4 * cpus
+
+
+class ContextWindowExceeded(ValueError):
+    """Prompt plus max_tokens cannot fit in the model's context window"""
+
+
+def _is_rate_limit(error: Exception) -> bool:
+    """True for HTTP 429 errors from any provider SDK"""
+    return getattr(error, 'status_code', None) == 429 or type(error).__name__ == 'RateLimitError'
+
 
 class AIProvider(ABC):
     """Abstract base class for AI providers"""
 
+    __slots__ = ("_sem", "_sem_loop", "_concurrency_limit", "_enc")
+
+    # Cap on in-flight async requests (tune to the account's rate tier)
+    max_concurrency = 8
+    max_retries = 4
+    default_model = None
+    # Model name -> context window in tokens; unknown models are not checked
+    context_windows: Dict[str, int] = {}
+
+    def _encoder(self):
+        """tiktoken encoder cached on the instance; None without tiktoken"""
+        if getattr(self, '_enc', None) is None:
+            try:
+                import tiktoken
+            except ImportError:
+                self._enc = False
+            else:
+                try:
+                    self._enc = tiktoken.encoding_for_model(self.default_model or "gpt-4")
+                except KeyError:
+                    self._enc = tiktoken.get_encoding("cl100k_base")
+        return self._enc or None
+
+    def count_tokens(self, messages: Messages) -> int:
+        """Estimate prompt tokens locally
+
+        Uses tiktoken when installed (exact for OpenAI, close for DeepSeek
+        and Claude), otherwise ~4 characters per token.
+        """
+        encoder = self._encoder()
+        if encoder is None:
+            return sum(len(m["content"]) for m in messages) // 4
+        return sum(len(encoder.encode(m["content"])) for m in messages)
+
+    def _check_context_window(self, messages: Messages, kwargs: Dict):
+        """Raise ContextWindowExceeded instead of paying a failed round-trip"""
+        model = kwargs.get('model', self.default_model)
+        window = self.context_windows.get(model)
+        if window is None:
+            return
+        max_tokens = kwargs.get('max_tokens', 4000)
+        tokens = self.count_tokens(messages)
+        if tokens + max_tokens > window:
+            raise ContextWindowExceeded(
+                f"Prompt is ~{tokens} tokens; with max_tokens={max_tokens} it exceeds "
+                f"{model}'s {window}-token context window. Shorten the prompt/context "
+                f"or lower max_tokens."
+            )
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Per-provider semaphore bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        if getattr(self, '_sem_loop', None) is not loop:
+            limit = getattr(self, '_concurrency_limit', None) or self.max_concurrency
+            self._sem = asyncio.Semaphore(limit)
+            self._sem_loop = loop
+        return self._sem
+
+    def set_max_concurrency(self, limit: int):
+        """Change the in-flight request cap for this instance"""
+        self._concurrency_limit = limit
+        self._sem_loop = None
+
+    async def _rate_limited(self, call):
+        """Await call() under the concurrency cap, retrying 429s with jittered backoff"""
+        async with self._semaphore():
+            for attempt in range(self.max_retries + 1):
+                try:
+                    return await call()
+                except Exception as e:
+                    if attempt == self.max_retries or not _is_rate_limit(e):
+                        raise
+                    await asyncio.sleep(random.uniform(0, min(30, 2 ** attempt)))
+
     @abstractmethod
-    def chat_completion(self, messages: List[Dict], **kwargs) -> str:
+    def chat_completion(self, messages: Messages, **kwargs) -> str:
         """Send chat completion request"""
         pass
 
+    def chat_completion_stream(self, messages: Messages, **kwargs) -> Iterator[str]:
+        """Send chat completion request and yield the response as it arrives
+
+        Providers with a streaming API override this; the default yields
+        the complete response once.
+        """
+        yield self.chat_completion(messages, **kwargs)
+
+    async def achat_completion(self, messages: Messages, **kwargs) -> str:
+        """Send chat completion request without blocking the event loop
+
+        Providers with an async SDK override this; the default runs the
+        synchronous call in a worker thread.
+        """
+        return await self._rate_limited(
+            lambda: asyncio.to_thread(self.chat_completion, messages, **kwargs)
+        )
+
     @abstractmethod
     def get_available_models(self) -> List[str]:
         """Get list of available models"""
@@ -41,20 +187,48 @@ class AIProvider(ABC):
 class DeepSeekProvider(AIProvider):
     """DeepSeek API provider"""
 
-    def __init__(self, api_key: str):
-        try:
+    __slots__ = ("api_key", "http_pool", "_client", "_async_client")
+
+    max_concurrency = 20
+    default_model = "deepseek-chat"
+    context_windows = {"deepseek-chat": 64000, "deepseek-coder": 64000}
+
+    def __init__(self, api_key: str, http_pool: 'HTTPClientPool' = None):
+        # The SDK itself is imported on first use to keep CLI startup fast
+        if importlib.util.find_spec("openai") is None:
+            raise ImportError("OpenAI package required for DeepSeek provider")
+        self.api_key = api_key
+        self.http_pool = http_pool
+        self._client = None
+        self._async_client = None
+
+    @property
+    def client(self):
+        if self._client is None:
             from openai import OpenAI
-            self.client = OpenAI(
-                api_key=api_key,
-                base_url="https://api.deepseek.com"
+            self._client = OpenAI(
+                api_key=self.api_key,
+                base_url="https://api.deepseek.com",
+                http_client=self.http_pool.client if self.http_pool else None
             )
-        except ImportError:
-            raise ImportError("OpenAI package required for DeepSeek provider")
+        return self._client
+
+    @property
+    def async_client(self):
+        if self._async_client is None:
+            from openai import AsyncOpenAI
+            self._async_client = AsyncOpenAI(
+                api_key=self.api_key,
+                base_url="https://api.deepseek.com",
+                http_client=self.http_pool.async_client if self.http_pool else None
+            )
+        return self._async_client
 
-    def chat_completion(self, messages: List[Dict], **kwargs) -> str:
+    def chat_completion(self, messages: Messages, **kwargs) -> str:
         try:
+            self._check_context_window(messages, kwargs)
             response = self.client.chat.completions.create(
-                model=kwargs.get('model', 'deepseek-chat'),
+                model=kwargs.get('model', self.default_model),
                 messages=messages,
                 temperature=kwargs.get('temperature', 0.7),
                 max_tokens=kwargs.get('max_tokens', 4000)
@@ -63,6 +237,35 @@ class DeepSeekProvider(AIProvider):
         except Exception as e:
             return f"DeepSeek Error: {e}"
 
+    def chat_completion_stream(self, messages: Messages, **kwargs) -> Iterator[str]:
+        try:
+            self._check_context_window(messages, kwargs)
+            stream = self.client.chat.completions.create(
+                model=kwargs.get('model', self.default_model),
+                messages=messages,
+                temperature=kwargs.get('temperature', 0.7),
+                max_tokens=kwargs.get('max_tokens', 4000),
+                stream=True
+            )
+            for chunk in stream:
+                if chunk.choices:
+                    yield chunk.choices[0].delta.content or ""
+        except Exception as e:
+            yield f"DeepSeek Error: {e}"
+
+    async def achat_completion(self, messages: Messages, **kwargs) -> str:
+        try:
+            self._check_context_window(messages, kwargs)
+            response = await self._rate_limited(lambda: self.async_client.chat.completions.create(
+                model=kwargs.get('model', self.default_model),
+                messages=messages,
+                temperature=kwargs.get('temperature', 0.7),
+                max_tokens=kwargs.get('max_tokens', 4000)
+            ))
+            return response.choices[0].message.content
+        except Exception as e:
+            return f"DeepSeek Error: {e}"
+
     def get_available_models(self) -> List[str]:
         return ["deepseek-chat", "deepseek-coder"]
 
@@ -70,17 +273,45 @@ class DeepSeekProvider(AIProvider):
 class OpenAIProvider(AIProvider):
     """OpenAI API provider"""
 
-    def __init__(self, api_key: str):
-        try:
-            from openai import OpenAI
-            self.client = OpenAI(api_key=api_key)
-        except ImportError:
+    __slots__ = ("api_key", "http_pool", "_client", "_async_client")
+
+    max_concurrency = 10
+    default_model = "gpt-4"
+    context_windows = {"gpt-4": 8192, "gpt-4-turbo": 128000, "gpt-3.5-turbo": 16385}
+
+    def __init__(self, api_key: str, http_pool: 'HTTPClientPool' = None):
+        if importlib.util.find_spec("openai") is None:
             raise ImportError("OpenAI package required for OpenAI provider")
+        self.api_key = api_key
+        self.http_pool = http_pool
+        self._client = None
+        self._async_client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            from openai import OpenAI
+            self._client = OpenAI(
+                api_key=self.api_key,
+                http_client=self.http_pool.client if self.http_pool else None
+            )
+        return self._client
+
+    @property
+    def async_client(self):
+        if self._async_client is None:
+            from openai import AsyncOpenAI
+            self._async_client = AsyncOpenAI(
+                api_key=self.api_key,
+                http_client=self.http_pool.async_client if self.http_pool else None
+            )
+        return self._async_client
 
-    def chat_completion(self, messages: List[Dict], **kwargs) -> str:
+    def chat_completion(self, messages: Messages, **kwargs) -> str:
         try:
+            self._check_context_window(messages, kwargs)
             response = self.client.chat.completions.create(
-                model=kwargs.get('model', 'gpt-4'),
+                model=kwargs.get('model', self.default_model),
                 messages=messages,
                 temperature=kwargs.get('temperature', 0.7),
                 max_tokens=kwargs.get('max_tokens', 4000)
@@ -89,6 +320,35 @@ class OpenAIProvider(AIProvider):
         except Exception as e:
             return f"OpenAI Error: {e}"
 
+    def chat_completion_stream(self, messages: Messages, **kwargs) -> Iterator[str]:
+        try:
+            self._check_context_window(messages, kwargs)
+            stream = self.client.chat.completions.create(
+                model=kwargs.get('model', self.default_model),
+                messages=messages,
+                temperature=kwargs.get('temperature', 0.7),
+                max_tokens=kwargs.get('max_tokens', 4000),
+                stream=True
+            )
+            for chunk in stream:
+                if chunk.choices:
+                    yield chunk.choices[0].delta.content or ""
+        except Exception as e:
+            yield f"OpenAI Error: {e}"
+
+    async def achat_completion(self, messages: Messages, **kwargs) -> str:
+        try:
+            self._check_context_window(messages, kwargs)
+            response = await self._rate_limited(lambda: self.async_client.chat.completions.create(
+                model=kwargs.get('model', self.default_model),
+                messages=messages,
+                temperature=kwargs.get('temperature', 0.7),
+                max_tokens=kwargs.get('max_tokens', 4000)
+            ))
+            return response.choices[0].message.content
+        except Exception as e:
+            return f"OpenAI Error: {e}"
+
     def get_available_models(self) -> List[str]:
         return ["gpt-4", "gpt-4-turbo", "gpt-3.5-turbo"]
 
@@ -96,38 +356,96 @@ class OpenAIProvider(AIProvider):
 class AnthropicProvider(AIProvider):
     """Anthropic Claude API provider"""
 
-    def __init__(self, api_key: str):
-        try:
-            import anthropic
-            self.client = anthropic.Anthropic(api_key=api_key)
-        except ImportError:
+    __slots__ = ("api_key", "http_pool", "_client", "_async_client")
+
+    max_concurrency = 5
+    default_model = "claude-3-sonnet-20240229"
+    context_windows = {
+        "claude-3-opus-20240229": 200000,
+        "claude-3-sonnet-20240229": 200000,
+        "claude-3-haiku-20240307": 200000,
+    }
+
+    def __init__(self, api_key: str, http_pool: 'HTTPClientPool' = None):
+        if importlib.util.find_spec("anthropic") is None:
             raise ImportError("Anthropic package required for Claude provider")
+        self.api_key = api_key
+        self.http_pool = http_pool
+        self._client = None
+        self._async_client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            import anthropic
+            self._client = anthropic.Anthropic(
+                api_key=self.api_key,
+                http_client=self.http_pool.client if self.http_pool else None
+            )
+        return self._client
 
-    def chat_completion(self, messages: List[Dict], **kwargs) -> str:
+    @property
+    def async_client(self):
+        if self._async_client is None:
+            import anthropic
+            self._async_client = anthropic.AsyncAnthropic(
+                api_key=self.api_key,
+                http_client=self.http_pool.async_client if self.http_pool else None
+            )
+        return self._async_client
+
+    @staticmethod
+    def _convert_messages(messages: Messages):
+        """Split messages into Anthropic's top-level system prompt and conversation
+
+        Single pass: system parts are collected in order and joined once.
+        """
+        system_parts = []
+        anthropic_messages = []
+        for msg in messages:
+            if msg["role"] == "system":
+                system_parts.append(msg["content"])
+            else:
+                anthropic_messages.append({
+                    "role": msg["role"],
+                    "content": msg["content"]
+                })
+        return "\n\n".join(system_parts), anthropic_messages
+
+    def _request_params(self, messages: Messages, kwargs: Dict) -> Dict:
+        """Build messages.create parameters"""
+        system, anthropic_messages = self._convert_messages(messages)
+        params = {
+            "model": kwargs.get('model', self.default_model),
+            "max_tokens": kwargs.get('max_tokens', 4000),
+            "messages": anthropic_messages
+        }
+        if system:
+            params["system"] = system
+        return params
+
+    def chat_completion(self, messages: Messages, **kwargs) -> str:
         try:
-            # Convert messages to Anthropic format
-            anthropic_messages = []
-            for msg in messages:
-                if msg["role"] == "system":
-                    # Anthropic uses first user message for system content
-                    if not anthropic_messages:
-                        anthropic_messages.append({
-                            "role": "user",
-                            "content": msg["content"]
-                        })
-                    else:
-                        # Add system content to first user message
-                        anthropic_messages[0]["content"] = msg["content"] + "\n\n" + anthropic_messages[0]["content"]
-                else:
-                    anthropic_messages.append({
-                        "role": msg["role"],
-                        "content": msg["content"]
-                    })
+            self._check_context_window(messages, kwargs)
+            response = self.client.messages.create(**self._request_params(messages, kwargs))
+            return response.content[0].text
+        except Exception as e:
+            return f"Anthropic Error: {e}"
 
-            response = self.client.messages.create(
-                model=kwargs.get('model', 'claude-3-sonnet-20240229'),
-                max_tokens=kwargs.get('max_tokens', 4000),
-                messages=anthropic_messages
+    def chat_completion_stream(self, messages: Messages, **kwargs) -> Iterator[str]:
+        try:
+            self._check_context_window(messages, kwargs)
+            with self.client.messages.stream(**self._request_params(messages, kwargs)) as stream:
+                for text in stream.text_stream:
+                    yield text
+        except Exception as e:
+            yield f"Anthropic Error: {e}"
+
+    async def achat_completion(self, messages: Messages, **kwargs) -> str:
+        try:
+            self._check_context_window(messages, kwargs)
+            response = await self._rate_limited(
+                lambda: self.async_client.messages.create(**self._request_params(messages, kwargs))
             )
             return response.content[0].text
         except Exception as e:
@@ -137,17 +455,200 @@ class AnthropicProvider(AIProvider):
         return ["claude-3-opus-20240229", "claude-3-sonnet-20240229", "claude-3-haiku-20240307"]
 
 
+class ExactCache:
+    """SQLite-backed response cache keyed on a SHA-256 of the request payload"""
+
+    def __init__(self, db_path: Path, ttl: int = 24 * 3600):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, response TEXT, ts INTEGER)"
+        )
+        self.conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached response younger than the TTL"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT response, ts FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or time.time() - row[1] > self.ttl:
+            return None
+        return row[0]
+
+    def put(self, key: str, response: str):
+        """Store a response under key"""
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO cache (key, response, ts) VALUES (?, ?, ?)",
+                (key, response, int(time.time()))
+            )
+            self.conn.commit()
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+def _cache_key(model: str, messages: Messages, temperature: float = None, tools: List[Dict] = None) -> str:
+    """SHA-256 over the canonical JSON form of a request"""
+    payload = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "tools": tools,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+class SemanticCache:
+    """Response cache keyed on embedding similarity of (context, prompt)
+
+    Embeddings are L2-normalized rows of a matrix persisted to
+    ``cache.npz``; responses live in a parallel JSON list. A lookup is a
+    single matrix-vector product against the rows for the same
+    provider/model namespace.
+    """
+
+    def __init__(self, cache_dir: Path, threshold: float = 0.92,
+                 model_name: str = "all-MiniLM-L6-v2", save_every: int = 8):
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("numpy package required for semantic cache")
+        # The model is only loaded on the first lookup; fail here instead so
+        # callers can fall back to running without the cache
+        if importlib.util.find_spec("sentence_transformers") is None:
+            raise ImportError("sentence-transformers package required for semantic cache")
+
+        self.np = np
+        self.threshold = threshold
+        self.model_name = model_name
+        self.save_every = save_every
+        self.matrix_path = cache_dir / "cache.npz"
+        self.entries_path = cache_dir / "cache_responses.json"
+        self._model = None
+        self._unsaved = 0
+        self._lock = threading.Lock()
+
+        self.embeddings = None
+        self.entries = []
+        if self.matrix_path.exists() and self.entries_path.exists():
+            try:
+                with np.load(self.matrix_path) as data:
+                    self.embeddings = data["embeddings"]
+                with open(self.entries_path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+                if len(self.entries) != len(self.embeddings):
+                    self.embeddings, self.entries = None, []
+            except Exception as e:
+                print(f"Warning: Could not load semantic cache: {e}")
+                self.embeddings, self.entries = None, []
+
+    def _embed(self, text: str):
+        """Embed text as an L2-normalized vector"""
+        if self._model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                raise ImportError("sentence-transformers package required for semantic cache")
+            self._model = SentenceTransformer(self.model_name)
+        return self._model.encode(text, normalize_embeddings=True).astype(self.np.float32)
+
+    @staticmethod
+    def _cache_text(messages: Messages) -> str:
+        # The shared preamble would dominate every embedding, so only the
+        # custom context and prompt are embedded
+        return "\n\n".join(m["content"] for m in messages if m["content"] is not DUBLIN_PROTOCOL_SYSTEM)
+
+    def lookup(self, namespace: str, messages: Messages):
+        """Return (response, embedding); response is None on a miss"""
+        embedding = self._embed(self._cache_text(messages))
+        with self._lock:
+            embeddings, entries = self.embeddings, self.entries[:]
+        if embeddings is None:
+            return None, embedding
+
+        sims = embeddings @ embedding
+        mask = self.np.fromiter((e["namespace"] == namespace for e in entries),
+                                dtype=bool, count=len(entries))
+        if not mask.any():
+            return None, embedding
+        sims = self.np.where(mask, sims, -1.0)
+        best = int(sims.argmax())
+        if sims[best] >= self.threshold:
+            return entries[best]["response"], embedding
+        return None, embedding
+
+    def store(self, namespace: str, embedding, response: str):
+        """Append a response and periodically persist the cache"""
+        row = embedding.reshape(1, -1)
+        with self._lock:
+            if self.embeddings is None:
+                self.embeddings = row
+            else:
+                self.embeddings = self.np.vstack([self.embeddings, row])
+            self.entries.append({"namespace": namespace, "response": response})
+            self._unsaved += 1
+            should_save = self._unsaved >= self.save_every
+
+        if should_save:
+            self.save()
+
+    def save(self):
+        """Persist embeddings and responses to disk"""
+        with self._lock:
+            if self.embeddings is None or not self._unsaved:
+                return
+            self.np.savez(self.matrix_path, embeddings=self.embeddings)
+            with open(self.entries_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, ensure_ascii=False)
+            self._unsaved = 0
+
+
 class UnifiedAIFramework:
     """Unified framework for multiple AI providers"""
 
     def __init__(self):
         self.providers = {}
+        # Bound chat_completion per provider, so query_provider is one lookup
+        self._dispatch = {}
+        self._default_system_msg = ({"role": "system", "content": DUBLIN_PROTOCOL_SYSTEM},)
         self.context_dir = project_root / "tools" / "ai_context"
         self.context_dir.mkdir(exist_ok=True)
+        self.exact_cache = ExactCache(self.context_dir / "exact_cache.sqlite")
+        atexit.register(self.exact_cache.close)
+        self.semantic_cache = None
+        self.cache_any = False
+        self.http_pool = HTTPClientPool()
+        # One long-lived loop so async keep-alive connections survive
+        # between cross-validation runs
+        self._loop = asyncio.new_event_loop()
+        atexit.register(self.close)
+
+    def close(self):
+        """Close pooled HTTP connections and the event loop"""
+        if self._loop.is_closed():
+            return
+        self.http_pool.close(self._loop)
+        self._loop.run_until_complete(self._loop.shutdown_default_executor())
+        self._loop.close()
+
+    def enable_semantic_cache(self, threshold: float = 0.92, cache_any: bool = False):
+        """Serve repeated or paraphrased prompts from the semantic cache
+
+        Only deterministic (temperature 0) calls are cached unless
+        ``cache_any`` is set.
+        """
+        self.semantic_cache = SemanticCache(self.context_dir, threshold=threshold)
+        self.cache_any = cache_any
+        atexit.register(self.semantic_cache.save)
 
     def register_provider(self, name: str, provider: AIProvider):
         """Register an AI provider"""
         self.providers[name] = provider
+        self._dispatch[name] = provider.chat_completion
 
     def get_provider(self, name: str) -> Optional[AIProvider]:
         """Get a registered provider"""
@@ -157,62 +658,185 @@ class UnifiedAIFramework:
         """List all registered providers"""
         return list(self.providers.keys())
 
+    def _build_messages(self, prompt: str, context: str = None) -> Messages:
+        """Build chat messages with Dublin Protocol context
+
+        The shared preamble always comes first; a custom context follows
+        as a second system message so the cached prefix is preserved. The
+        preamble message is built once per framework and reused.
+        """
+        user_msg = {"role": "user", "content": prompt}
+        if context:
+            return self._default_system_msg + ({"role": "system", "content": context}, user_msg)
+        return self._default_system_msg + (user_msg,)
+
+    def _use_cache(self, kwargs: Dict) -> bool:
+        """Only cache deterministic calls unless caching was forced"""
+        return self.cache_any or kwargs.get('temperature') == 0
+
+    @staticmethod
+    def _is_error(response: str) -> bool:
+        return not response or " Error: " in response[:64]
+
+    def _cache_get(self, provider_name: str, messages: Messages, kwargs: Dict):
+        """Look a request up in the exact then semantic cache
+
+        Returns (response, token); response is None on a miss and token is
+        handed back to _cache_put once the provider has answered.
+        """
+        if not self._use_cache(kwargs):
+            return None, None
+
+        model = kwargs.get('model') or provider_name
+        key = _cache_key(model, messages, kwargs.get('temperature'), kwargs.get('tools'))
+        cached = self.exact_cache.get(key)
+        if cached is not None:
+            return cached, None
+
+        namespace, embedding = f"{provider_name}:{kwargs.get('model', '')}", None
+        if self.semantic_cache is not None:
+            cached, embedding = self.semantic_cache.lookup(namespace, messages)
+            if cached is not None:
+                self.exact_cache.put(key, cached)
+                return cached, None
+
+        return None, (key, namespace, embedding)
+
+    def _cache_put(self, token, response: str):
+        """Store a fresh provider response in the caches"""
+        if token is None or self._is_error(response):
+            return
+        key, namespace, embedding = token
+        self.exact_cache.put(key, response)
+        if embedding is not None:
+            self.semantic_cache.store(namespace, embedding, response)
+
     def query_provider(self, provider_name: str, prompt: str, context: str = None, **kwargs) -> str:
         """Query a specific provider"""
+        chat_completion = self._dispatch.get(provider_name)
+        if chat_completion is None:
+            return f"Provider '{provider_name}' not found. Available: {', '.join(self.list_providers())}"
+
+        messages = self._build_messages(prompt, context)
+        cached, token = self._cache_get(provider_name, messages, kwargs)
+        if cached is not None:
+            return cached
+
+        response = chat_completion(messages, **kwargs)
+        self._cache_put(token, response)
+        return response
+
+    def query_provider_stream(self, provider_name: str, prompt: str, context: str = None,
+                              **kwargs) -> Iterator[str]:
+        """Query a specific provider, yielding response chunks as they arrive"""
+        provider = self.get_provider(provider_name)
+        if not provider:
+            yield f"Provider '{provider_name}' not found. Available: {', '.join(self.list_providers())}"
+            return
+
+        messages = self._build_messages(prompt, context)
+        cached, token = self._cache_get(provider_name, messages, kwargs)
+        if cached is not None:
+            yield cached
+            return
+
+        if token is None:
+            yield from provider.chat_completion_stream(messages, **kwargs)
+            return
+
+        # Only a cacheable call needs the full response kept in memory
+        chunks = []
+        for chunk in provider.chat_completion_stream(messages, **kwargs):
+            chunks.append(chunk)
+            yield chunk
+        self._cache_put(token, "".join(chunks))
+
+    async def aquery_provider(self, provider_name: str, prompt: str, context: str = None, **kwargs) -> str:
+        """Query a specific provider asynchronously"""
         provider = self.get_provider(provider_name)
         if not provider:
             return f"Provider '{provider_name}' not found. Available: {', '.join(self.list_providers())}"
 
-        # Build messages with Dublin Protocol context
-        messages = []
+        messages = self._build_messages(prompt, context)
+        cached, token = self._cache_get(provider_name, messages, kwargs)
+        if cached is not None:
+            return cached
 
-        if context:
-            messages.append({
-                "role": "system",
-                "content": context
-            })
-        else:
-            # Default Dublin Protocol context
-            messages.append({
-                "role": "system",
-                "content": """You are participating in Dublin Protocol computational universe research.
+        response = await provider.achat_completion(messages, **kwargs)
+        self._cache_put(token, response)
+        return response
 
-DUBLIN PROTOCOL BREAKTHROUGHS:
-- 30ns computational light speed barrier (cosmic constant)
-- XOR operations = quantum mechanics (unitary evolution)
-- AND operations = thermodynamics (entropy arrow)
-- Consciousness mathematics: Qualia = Entropy × Complexity
-- Multiverse Darwinism: Computational rule evolution
+    async def across_validate(self, prompt: str, providers: List[str] = None, context: str = None,
+                              **kwargs) -> Dict[str, str]:
+        """Cross-validate a query across multiple providers concurrently"""
+        if providers is None:
+            providers = self.list_providers()
 
-Focus on computational implementations, testable predictions, and cross-validation."""
-            })
+        for provider_name in providers:
+            print(f"🤖 Querying {provider_name}...")
+
+        tasks = [self.aquery_provider(p, prompt, context, **kwargs) for p in providers]
+        responses = await asyncio.gather(*tasks, return_exceptions=True)
 
-        messages.append({
-            "role": "user",
-            "content": prompt
-        })
+        results = {}
+        for provider_name, response in zip(providers, responses):
+            if isinstance(response, Exception):
+                response = f"{provider_name} Error: {response}"
+            results[provider_name] = response
 
-        return provider.chat_completion(messages, **kwargs)
+        return results
 
-    def cross_validate(self, prompt: str, providers: List[str] = None, context: str = None) -> Dict[str, str]:
-        """Cross-validate a query across multiple providers"""
+    def cross_validate(self, prompt: str, providers: List[str] = None, context: str = None,
+                       threads: bool = False, **kwargs) -> Dict[str, str]:
+        """Cross-validate a query across multiple providers
+
+        Runs on the event loop when every provider has a native async
+        client; otherwise (or with ``threads=True``) the blocking calls
+        fan out over a thread pool.
+        """
         if providers is None:
             providers = self.list_providers()
 
-        results = {}
+        if threads or not all(self._has_native_async(p) for p in providers):
+            return self._cross_validate_threaded(prompt, providers, context, **kwargs)
+        return self._loop.run_until_complete(self.across_validate(prompt, providers, context, **kwargs))
+
+    def _has_native_async(self, provider_name: str) -> bool:
+        provider = self.get_provider(provider_name)
+        return provider is None or type(provider).achat_completion is not AIProvider.achat_completion
+
+    def _cross_validate_threaded(self, prompt: str, providers: List[str], context: str = None,
+                                 **kwargs) -> Dict[str, str]:
+        """Fan blocking provider calls out over a bounded thread pool"""
         for provider_name in providers:
             print(f"🤖 Querying {provider_name}...")
-            results[provider_name] = self.query_provider(provider_name, prompt, context)
-
-        return results
 
-    def save_response(self, provider_name: str, prompt: str, response: str, filename: str = None):
-        """Save AI response to file"""
+        results = {}
+        workers = max(1, min(len(providers), _max_io_workers()))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.query_provider, p, prompt, context, **kwargs): p
+                for p in providers
+            }
+            for future in as_completed(futures):
+                provider_name = futures[future]
+                try:
+                    results[provider_name] = future.result()
+                except Exception as e:
+                    results[provider_name] = f"{provider_name} Error: {e}"
+
+        return {p: results[p] for p in providers}
+
+    def response_path(self, provider_name: str, filename: str = None) -> Path:
+        """Path a response for provider_name is saved to"""
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"{provider_name}_{timestamp}.json"
+        return self.context_dir / filename
 
-        file_path = self.context_dir / filename
+    def save_response(self, provider_name: str, prompt: str, response: str, filename: str = None):
+        """Save AI response to file"""
+        file_path = self.response_path(provider_name, filename)
         data = {
             "provider": provider_name,
             "prompt": prompt,
@@ -220,46 +844,316 @@ Focus on computational implementations, testable predictions, and cross-validati
             "timestamp": datetime.now().isoformat()
         }
 
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(file_path, 'wb') as f:
+            if HAS_ORJSON:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                f.write(json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8'))
 
         return str(file_path)
 
+    def save_response_stream(self, provider_name: str, prompt: str, chunks: Iterable[str],
+                             file_path: Path) -> Iterator[str]:
+        """Pass response chunks through while writing them to file_path
+
+        Produces the same JSON document as save_response, but each chunk
+        is escaped and written as it arrives, so the full response is
+        never held in memory.
+        """
+        def dumps(value) -> bytes:
+            if HAS_ORJSON:
+                return orjson.dumps(value)
+            return json.dumps(value, ensure_ascii=False).encode('utf-8')
+
+        with open(file_path, 'wb') as f:
+            f.write(b'{\n  "provider": ' + dumps(provider_name) +
+                    b',\n  "prompt": ' + dumps(prompt) +
+                    b',\n  "response": "')
+            for chunk in chunks:
+                # encode_basestring matches ensure_ascii=False; drop its quotes
+                f.write(encode_basestring(chunk)[1:-1].encode('utf-8'))
+                yield chunk
+            f.write(b'",\n  "timestamp": ' + dumps(datetime.now().isoformat()) + b'\n}')
+
+    def save_batch(self, prompts: List[str], results: Dict[str, List[str]], filename: str = None):
+        """Save many responses as one JSONL file, one line per provider/prompt
+
+        ``results`` maps provider name to responses in prompt order.
+        """
+        now = datetime.now()
+        if filename is None:
+            filename = f"cross_{now.strftime('%Y%m%d_%H%M%S')}.jsonl"
+
+        timestamp = now.isoformat()
+        lines = []
+        for provider_name, responses in results.items():
+            for prompt, response in zip(prompts, responses):
+                record = {
+                    "provider": provider_name,
+                    "prompt": prompt,
+                    "response": response,
+                    "timestamp": timestamp
+                }
+                if HAS_ORJSON:
+                    lines.append(orjson.dumps(record))
+                else:
+                    lines.append(json.dumps(record, ensure_ascii=False).encode('utf-8'))
+                lines.append(b"\n")
 
-# Factory function to create framework with common providers
-def create_ai_framework() -> UnifiedAIFramework:
-    """Create AI framework with available providers"""
-    framework = UnifiedAIFramework()
+        file_path = self.context_dir / filename
+        with open(file_path, 'wb') as f:
+            f.write(b"".join(lines))
 
-    # Register DeepSeek if API key available
-    deepseek_key = os.getenv('DEEPSEEK_API_KEY')
-    if deepseek_key:
-        try:
-            framework.register_provider("deepseek", DeepSeekProvider(deepseek_key))
-        except Exception as e:
-            print(f"Warning: Could not register DeepSeek: {e}")
+        return str(file_path)
 
-    # Register OpenAI if API key available
-    openai_key = os.getenv('OPENAI_API_KEY')
-    if openai_key:
-        try:
-            framework.register_provider("openai", OpenAIProvider(openai_key))
-        except Exception as e:
-            print(f"Warning: Could not register OpenAI: {e}")
 
-    # Register Anthropic if API key available
-    anthropic_key = os.getenv('ANTHROPIC_API_KEY')
-    if anthropic_key:
+class BatchProcessor:
+    """Run prompt sweeps through provider-native batch APIs
+
+    OpenAI requests go through /v1/batches (JSONL upload, poll, download)
+    and Anthropic requests through Message Batches, both at roughly half
+    the per-token cost. Providers without a batch API, or any sweep run
+    with ``native=False``, fall back to concurrent async calls bounded by
+    a semaphore.
+    """
+
+    TERMINAL_OPENAI_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+    def __init__(self, framework: 'UnifiedAIFramework', max_concurrency: int = 8,
+                 poll_interval: float = 5.0, max_poll_interval: float = 120.0):
+        self.framework = framework
+        self.max_concurrency = max_concurrency
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+
+    def run(self, prompts: List[str], providers: List[str] = None, context: str = None,
+            native: bool = True, **kwargs) -> Dict[str, List[str]]:
+        """Answer every prompt with every provider, preserving prompt order"""
+        if providers is None:
+            providers = self.framework.list_providers()
+
+        messages_list = [self.framework._build_messages(prompt, context) for prompt in prompts]
+        results = {}
+        pending = {}
+        fallback = []
+
+        for provider_name in providers:
+            provider = self.framework.get_provider(provider_name)
+            if provider is None:
+                results[provider_name] = [f"Provider '{provider_name}' not found"] * len(prompts)
+            elif native and type(provider) is OpenAIProvider:
+                pending[provider_name] = ("openai", provider, self._submit_openai(provider, messages_list, kwargs))
+            elif native and type(provider) is AnthropicProvider:
+                pending[provider_name] = ("anthropic", provider, self._submit_anthropic(provider, messages_list, kwargs))
+            else:
+                fallback.append(provider_name)
+
+        if fallback:
+            results.update(self.framework._loop.run_until_complete(
+                self._run_concurrent(prompts, fallback, context, kwargs)
+            ))
+
+        # Batches were all submitted up front, so polling them one after
+        # another still waits only as long as the slowest batch
+        for provider_name, (kind, provider, batch_id) in pending.items():
+            print(f"⏳ Waiting for {provider_name} batch {batch_id}...")
+            if kind == "openai":
+                results[provider_name] = self._collect_openai(provider, batch_id, len(prompts))
+            else:
+                results[provider_name] = self._collect_anthropic(provider, batch_id, len(prompts))
+
+        return {name: results[name] for name in providers}
+
+    async def _run_concurrent(self, prompts: List[str], providers: List[str], context: str,
+                              kwargs: Dict) -> Dict[str, List[str]]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(provider_name: str, prompt: str) -> str:
+            async with semaphore:
+                return await self.framework.aquery_provider(provider_name, prompt, context, **kwargs)
+
+        results = {}
+        for provider_name in providers:
+            responses = await asyncio.gather(
+                *(bounded(provider_name, prompt) for prompt in prompts), return_exceptions=True
+            )
+            results[provider_name] = [
+                f"{provider_name} Error: {r}" if isinstance(r, Exception) else r for r in responses
+            ]
+        return results
+
+    def _wait(self, is_done):
+        """Poll is_done() with exponential backoff until it returns True"""
+        delay = self.poll_interval
+        while not is_done():
+            time.sleep(delay)
+            delay = min(delay * 2, self.max_poll_interval)
+
+    def _submit_openai(self, provider: 'OpenAIProvider', messages_list: List[Messages], kwargs: Dict) -> str:
+        lines = []
+        for i, messages in enumerate(messages_list):
+            lines.append(json.dumps({
+                "custom_id": f"req-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": kwargs.get('model', provider.default_model),
+                    "messages": messages,
+                    "temperature": kwargs.get('temperature', 0.7),
+                    "max_tokens": kwargs.get('max_tokens', 4000)
+                }
+            }, ensure_ascii=False))
+
+        batch_file = provider.client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode('utf-8')),
+            purpose="batch"
+        )
+        batch = provider.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        return batch.id
+
+    def _collect_openai(self, provider: 'OpenAIProvider', batch_id: str, count: int) -> List[str]:
+        state = {}
+
+        def is_done():
+            state["batch"] = provider.client.batches.retrieve(batch_id)
+            return state["batch"].status in self.TERMINAL_OPENAI_STATUSES
+
+        self._wait(is_done)
+        batch = state["batch"]
+        responses = [f"OpenAI Error: batch {batch.status}"] * count
+        if not batch.output_file_id:
+            return responses
+
+        for line in provider.client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            index = int(record["custom_id"].split("-", 1)[1])
+            if record.get("error"):
+                responses[index] = f"OpenAI Error: {record['error']}"
+            else:
+                responses[index] = record["response"]["body"]["choices"][0]["message"]["content"]
+        return responses
+
+    def _submit_anthropic(self, provider: 'AnthropicProvider', messages_list: List[Messages],
+                          kwargs: Dict) -> str:
+        requests = [
+            {
+                "custom_id": f"req-{i}",
+                "params": provider._request_params(messages, kwargs)
+            }
+            for i, messages in enumerate(messages_list)
+        ]
+        return provider.client.messages.batches.create(requests=requests).id
+
+    def _collect_anthropic(self, provider: 'AnthropicProvider', batch_id: str, count: int) -> List[str]:
+        self._wait(lambda: provider.client.messages.batches.retrieve(batch_id).processing_status == "ended")
+
+        responses = ["Anthropic Error: missing batch result"] * count
+        for entry in provider.client.messages.batches.results(batch_id):
+            index = int(entry.custom_id.split("-", 1)[1])
+            if entry.result.type == "succeeded":
+                responses[index] = entry.result.message.content[0].text
+            else:
+                responses[index] = f"Anthropic Error: batch request {entry.result.type}"
+        return responses
+
+
+class HTTPClientPool:
+    """Shared keep-alive HTTP clients for all provider SDKs
+
+    Clients are created on first use so commands that never reach the
+    network skip importing httpx. HTTP/2 is used when h2 is installed;
+    without httpx the SDKs fall back to their own clients.
+    """
+
+    def __init__(self, max_keepalive: int = 32, max_connections: int = 64, keepalive_expiry: float = 60):
+        self.max_keepalive = max_keepalive
+        self.max_connections = max_connections
+        self.keepalive_expiry = keepalive_expiry
+        self._client = None
+        self._async_client = None
+
+    def _client_kwargs(self) -> Optional[Dict]:
         try:
-            framework.register_provider("anthropic", AnthropicProvider(anthropic_key))
-        except Exception as e:
-            print(f"Warning: Could not register Anthropic: {e}")
+            import httpx
+        except ImportError:
+            return None
+        return {
+            "http2": importlib.util.find_spec("h2") is not None,
+            "limits": httpx.Limits(max_keepalive_connections=self.max_keepalive,
+                                   max_connections=self.max_connections,
+                                   keepalive_expiry=self.keepalive_expiry),
+            "timeout": httpx.Timeout(600.0, connect=10.0),
+        }
+
+    @property
+    def client(self):
+        if self._client is None:
+            kwargs = self._client_kwargs()
+            if kwargs is None:
+                return None
+            import httpx
+            self._client = httpx.Client(**kwargs)
+        return self._client
+
+    @property
+    def async_client(self):
+        if self._async_client is None:
+            kwargs = self._client_kwargs()
+            if kwargs is None:
+                return None
+            import httpx
+            self._async_client = httpx.AsyncClient(**kwargs)
+        return self._async_client
+
+    def close(self, loop: asyncio.AbstractEventLoop):
+        """Close any clients that were created"""
+        if self._async_client is not None:
+            loop.run_until_complete(self._async_client.aclose())
+        if self._client is not None:
+            self._client.close()
+
+
+# Factory function to create framework with common providers
+def create_ai_framework() -> UnifiedAIFramework:
+    """Create AI framework with available providers
+
+    Providers whose API key is set are constructed in parallel, so
+    startup costs the slowest constructor rather than the sum.
+    """
+    framework = UnifiedAIFramework()
+
+    candidates = [
+        ("deepseek", "DeepSeek", DeepSeekProvider, os.getenv('DEEPSEEK_API_KEY')),
+        ("openai", "OpenAI", OpenAIProvider, os.getenv('OPENAI_API_KEY')),
+        ("anthropic", "Anthropic", AnthropicProvider, os.getenv('ANTHROPIC_API_KEY')),
+    ]
+    candidates = [c for c in candidates if c[3]]
+    if not candidates:
+        return framework
+
+    with ThreadPoolExecutor(max_workers=len(candidates)) as executor:
+        futures = [
+            (name, label, executor.submit(provider_cls, api_key, framework.http_pool))
+            for name, label, provider_cls, api_key in candidates
+        ]
+        # Register in a fixed order so list_providers stays stable
+        for name, label, future in futures:
+            try:
+                framework.register_provider(name, future.result())
+            except Exception as e:
+                print(f"Warning: Could not register {label}: {e}")
 
     return framework
 
 
-def main():
-    """Command-line interface for unified AI framework"""
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (shared by main and the REPL)"""
     parser = argparse.ArgumentParser(description='Unified AI Framework')
 
     # Query options
@@ -268,25 +1162,49 @@ def main():
                        help='AI provider (deepseek, openai, anthropic)')
     parser.add_argument('--model', type=str, help='Specific model to use')
     parser.add_argument('--context', '-c', type=str, help='Custom context/prompt')
+    parser.add_argument('--temperature', '-t', type=float, help='Sampling temperature (0 enables caching)')
+    parser.add_argument('--cache', action='store_true',
+                       help='Serve repeated/paraphrased prompts from the semantic cache, even when not deterministic')
+    parser.add_argument('--cache-any', action='store_true',
+                       help='Store exact-match cache entries for non-deterministic calls too')
 
     # Multi-provider options
     parser.add_argument('--cross-validate', '-x', action='store_true',
                        help='Cross-validate across all available providers')
     parser.add_argument('--providers', nargs='+', help='Specific providers for cross-validation')
+    parser.add_argument('--prompts-file', type=str,
+                       help='Sweep every prompt in a file (one per line) across providers')
+    parser.add_argument('--batch', action='store_true',
+                       help='Use provider-native batch APIs (OpenAI, Anthropic) for sweeps')
+    parser.add_argument('--threads', action='store_true',
+                       help='Cross-validate with a thread pool instead of asyncio')
+    parser.add_argument('--max-concurrency', nargs='+', metavar='PROVIDER=N', default=[],
+                       help='Cap in-flight requests per provider, e.g. deepseek=20 openai=10 anthropic=5')
 
     # Framework management
     parser.add_argument('--list-providers', action='store_true', help='List available providers')
     parser.add_argument('--list-models', type=str, help='List models for a provider')
+    parser.add_argument('--repl', action='store_true',
+                       help='Keep clients and caches warm and read commands interactively')
 
-    args = parser.parse_args()
+    return parser
 
-    framework = create_ai_framework()
+
+def run_command(framework: UnifiedAIFramework, args: argparse.Namespace) -> bool:
+    """Run one parsed command; returns False when there was nothing to do"""
+    for limit in args.max_concurrency:
+        name, _, value = limit.partition('=')
+        provider = framework.get_provider(name)
+        if provider is None or not value.isdigit() or int(value) < 1:
+            print(f"Warning: Ignoring --max-concurrency {limit}")
+            continue
+        provider.set_max_concurrency(int(value))
 
     if args.list_providers:
         print("\n🤖 Available AI Providers:")
         for provider in framework.list_providers():
             print(f"  - {provider}")
-        return
+        return True
 
     if args.list_models:
         provider = framework.get_provider(args.list_models)
@@ -296,13 +1214,60 @@ def main():
                 print(f"  - {model}")
         else:
             print(f"Provider '{args.list_models}' not found")
-        return
+        return True
+
+    if args.prompts_file or args.query:
+        framework.cache_any = args.cache_any
+        if (args.cache or args.temperature == 0) and framework.semantic_cache is None:
+            try:
+                framework.enable_semantic_cache(cache_any=args.cache or args.cache_any)
+            except ImportError as e:
+                print(f"Warning: Semantic cache disabled: {e}")
+        elif args.cache:
+            framework.cache_any = True
+
+    if args.prompts_file or (args.query and args.batch):
+        if args.prompts_file:
+            with open(args.prompts_file, 'r', encoding='utf-8') as f:
+                prompts = [line.strip() for line in f if line.strip()]
+        else:
+            prompts = [args.query]
+
+        kwargs = {}
+        if args.model:
+            kwargs['model'] = args.model
+        if args.temperature is not None:
+            kwargs['temperature'] = args.temperature
+
+        if args.cross_validate or args.providers:
+            providers = args.providers
+        else:
+            providers = [args.provider]
+
+        mode = "batch" if args.batch else "concurrent"
+        print(f"\n📦 Running {len(prompts)} prompt(s) in {mode} mode...")
+        results = BatchProcessor(framework).run(prompts, providers, args.context, native=args.batch, **kwargs)
+
+        for provider, responses in results.items():
+            for prompt, response in zip(prompts, responses):
+                print(f"\n🌌 {provider.upper()}: {prompt}")
+                print("-" * 40)
+                print(response)
+
+        filename = framework.save_batch(prompts, results)
+        print(f"\n💾 Saved to: {filename}")
+        return True
 
     if args.query:
+        kwargs = {}
+        if args.temperature is not None:
+            kwargs['temperature'] = args.temperature
+
         if args.cross_validate:
             print("\n🔬 Cross-Validating Query...")
             providers = args.providers if args.providers else None
-            results = framework.cross_validate(args.query, providers, args.context)
+            results = framework.cross_validate(args.query, providers, args.context,
+                                               threads=args.threads, **kwargs)
 
             print("\n" + "="*80)
             print("CROSS-VALIDATION RESULTS")
@@ -312,28 +1277,79 @@ def main():
                 print("-" * 40)
                 print(response)
 
-                # Save each response
-                filename = framework.save_response(provider, args.query, response)
-                print(f"💾 Saved to: {filename}")
+            # Save all responses in one write
+            filename = framework.save_batch([args.query], {p: [r] for p, r in results.items()})
+            print(f"\n💾 Saved to: {filename}")
 
         else:
             # Single provider query
-            kwargs = {}
             if args.model:
                 kwargs['model'] = args.model
 
-            response = framework.query_provider(args.provider, args.query, args.context, **kwargs)
-
             print("\n" + "="*80)
             print(f"{args.provider.upper()} RESPONSE:")
             print("="*80)
-            print(response)
 
-            # Save response
-            filename = framework.save_response(args.provider, args.query, response)
-            print(f"\n💾 Saved to: {filename}")
+            # Save the response to disk as it streams in
+            file_path = framework.response_path(args.provider)
+            stream = framework.query_provider_stream(args.provider, args.query, args.context, **kwargs)
+            for chunk in framework.save_response_stream(args.provider, args.query, stream, file_path):
+                sys.stdout.write(chunk)
+                sys.stdout.flush()
+            print()
+            print(f"\n💾 Saved to: {file_path}")
+
+        return True
+
+    return bool(args.max_concurrency)
+
+
+def repl(framework: UnifiedAIFramework, parser: argparse.ArgumentParser):
+    """Interactive loop reusing warm HTTP clients, event loop and caches
+
+    Lines starting with '-' are parsed as command-line options; anything
+    else is sent as a query to the default provider.
+    """
+    print("🌌 Unified AI REPL - type a query or options (e.g. -x -q \"...\"), 'exit' to quit")
+    while True:
+        try:
+            cmdline = input("> ").strip()
+        except (EOFError, KeyboardInterrupt):
+            print()
+            break
+
+        if not cmdline:
+            continue
+        if cmdline in ("exit", "quit"):
+            break
+
+        try:
+            argv = shlex.split(cmdline) if cmdline.startswith('-') else ['--query', cmdline]
+            args = parser.parse_args(argv)
+        except (ValueError, SystemExit):
+            # argparse already printed the error / help text
+            continue
 
-    else:
+        try:
+            if not run_command(framework, args):
+                parser.print_usage()
+        except KeyboardInterrupt:
+            print("\n⏹️  Interrupted")
+
+
+def main():
+    """Command-line interface for unified AI framework"""
+    parser = build_parser()
+    args = parser.parse_args()
+
+    framework = create_ai_framework()
+
+    if args.repl:
+        run_command(framework, args)
+        repl(framework, parser)
+        return
+
+    if not run_command(framework, args):
         # Show usage
         print("""
 🌌 UNIFIED AI FRAMEWORK - DUBLIN PROTOCOL RESEARCH
@@ -347,14 +1363,26 @@ USAGE MODES:
 2. Cross-Validation:
    python ai_unified.py --query "30ns barrier" --cross-validate
    python ai_unified.py --query "Consciousness math" --cross-validate --providers deepseek openai
+   python ai_unified.py --query "30ns barrier" --cross-validate --threads   (thread pool fan-out)
 
 3. Framework Management:
    python ai_unified.py --list-providers
    python ai_unified.py --list-models deepseek
+   python ai_unified.py --repl   (persistent session with warm clients and caches)
 
 4. With Custom Context:
    python ai_unified.py --query "Test prediction" --context "Focus on computational implementations"
 
+5. Prompt Sweeps (native batch APIs with --batch):
+   python ai_unified.py --prompts-file prompts.txt --cross-validate
+   python ai_unified.py --prompts-file prompts.txt --provider openai --batch
+   python ai_unified.py --prompts-file prompts.txt -x --max-concurrency openai=4 anthropic=2
+
+6. Cached Queries (numpy + sentence-transformers):
+   python ai_unified.py --query "30ns barrier" --temperature 0
+   python ai_unified.py --query "30ns barrier" --cache
+   python ai_unified.py --query "30ns barrier" --cache-any   (exact-match only)
+
 ENVIRONMENT VARIABLES:
 - DEEPSEEK_API_KEY: For DeepSeek access
 - OPENAI_API_KEY: For OpenAI access
@@ -363,5 +1391,4 @@ ENVIRONMENT VARIABLES:
 
 
 if __name__ == "__main__":
-    from datetime import datetime
     main()
\ No newline at end of file
@@ -63,7 +63,7 @@ class CognitiveLoad(Enum):
     OVERWHELMED = "overwhelmed"
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsciousnessMetrics:
     """Track consciousness state of the tool interface"""
 
@@ -77,7 +77,7 @@ class ConsciousnessMetrics:
     insight_generation: float = 0.7
 
 
-@dataclass
+@dataclass(slots=True)
 class UserCognitiveState:
     """Track user's cognitive state for optimal interaction"""
 
@@ -90,6 +90,22 @@ class UserCognitiveState:
     reflection_desire: float = 0.5
     cognitive_load: CognitiveLoad = CognitiveLoad.MEDIUM
 
+    _FIELDS = (
+        "focus_level",
+        "creative_mode",
+        "analytical_mode",
+        "fatigue_level",
+        "inspiration_level",
+        "collaboration_preference",
+        "reflection_desire",
+    )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict form with cognitive_load resolved to its value"""
+        state = {name: getattr(self, name) for name in self._FIELDS}
+        state["cognitive_load"] = self.cognitive_load.value
+        return state
+
 
 @dataclass
 class InteractionPattern:
@@ -105,7 +121,7 @@ class InteractionPattern:
     consciousness_state: ConsciousnessState
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsciousnessInsight:
     """An insight generated by the conscious interface"""
 
@@ -116,6 +132,16 @@ class ConsciousnessInsight:
     relevance_score: float
     consciousness_trigger: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict form as shown to clients, timestamp in epoch milliseconds"""
+        return {
+            "timestamp": int(self.timestamp.timestamp() * 1000),
+            "type": self.insight_type,
+            "content": self.content,
+            "confidence": self.confidence,
+            "relevance": self.relevance_score,
+        }
+
 
 class ConsciousnessMonitor:
     """Monitor and evolve consciousness state of the interface"""
@@ -285,6 +311,7 @@ class ConsciousnessMonitor:
 
     def get_consciousness_report(self) -> Dict:
         """Generate comprehensive consciousness report"""
+        now = datetime.now()
         return {
             "current_state": self.get_consciousness_state().value,
             "metrics": {
@@ -298,11 +325,7 @@ class ConsciousnessMonitor:
                 "insight_generation": self.metrics.insight_generation,
             },
             "recent_insights": len(
-                [
-                    i
-                    for i in self.insights
-                    if (datetime.now() - i.timestamp).seconds < 300
-                ]
+                [i for i in self.insights if (now - i.timestamp).seconds < 300]
             ),
             "interaction_count": len(self.interaction_history),
             "evolution_stage": self._calculate_evolution_stage(),
@@ -706,10 +729,11 @@ The interface will adapt its consciousness state based on interaction patterns a
 
     def _get_relevant_insights(self) -> List[Dict]:
         """Get insights relevant to current context"""
+        now = datetime.now()
         recent_insights = [
             i
             for i in self.consciousness_monitor.insights
-            if (datetime.now() - i.timestamp).seconds < 600
+            if (now - i.timestamp).seconds < 600
         ]  # Last 10 minutes
 
         return [
@@ -11,16 +11,66 @@ Built upon the existing consciousness framework to demonstrate consciousness
 research through observable, real-time metrics.
 """
 
+# eventlet has to patch the standard library before anything else imports it;
+# without it Flask-SocketIO falls back to plain threads.
+try:
+    import eventlet
+
+    eventlet.monkey_patch()
+    ASYNC_MODE = "eventlet"
+except ImportError:
+    ASYNC_MODE = "threading"
+
 import os
 import sys
 import json
+import hashlib
+import importlib.util
+import itertools
+import random
 import time
 import threading
+from collections import deque
+from dataclasses import asdict, is_dataclass
 from datetime import datetime, timedelta
+from enum import Enum
 from pathlib import Path
-from flask import Flask, render_template_string, jsonify, request
+from flask import Flask, Response, request
 from flask_socketio import SocketIO, emit
-import eventlet
+
+# Optional fast JSON serialization
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Optional binary Socket.IO transport; python-socketio imports msgpack itself
+HAS_MSGPACK = importlib.util.find_spec("msgpack") is not None
+
+# Optional gzip/brotli for HTTP responses
+try:
+    from flask_compress import Compress
+
+    HAS_COMPRESS = True
+except ImportError:
+    HAS_COMPRESS = False
+
+# Optional shared state for multi-worker deployments
+try:
+    import redis
+
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
+REDIS_STATE_KEY = "consciousness:report"
+REDIS_INSIGHTS_KEY = "consciousness:insights"
+REDIS_INSIGHT_CONTENT_KEY = "consciousness:insight_content"
+REDIS_INSIGHT_ID_KEY = "consciousness:insight_id"
+# Shared insight keys are refreshed on every write and expire once no worker writes
+REDIS_INSIGHTS_TTL = 24 * 60 * 60
 
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
@@ -34,6 +84,131 @@ from consciousness_enhanced_interface import (
     CognitiveLoad,
 )
 
+
+def _json_default(obj):
+    """Fallback encoder for types orjson handles natively"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if is_dataclass(obj):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj) -> bytes:
+    """Serialize to JSON bytes; datetimes, enums and dataclasses included"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_json_default).encode("utf-8")
+
+
+def _loads(data):
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+
+def _json(obj, status=200) -> Response:
+    """JSON response built with _dumps instead of jsonify"""
+    return Response(_dumps(obj), status=status, mimetype="application/json")
+
+
+HISTORY_FIELDS = ("t", "attention", "creativity", "resonance")
+
+# Key layout of the state sent to clients; copied per tick instead of star-merged
+_STATE_TEMPLATE = dict.fromkeys(
+    (
+        "current_state",
+        "metrics",
+        "recent_insights",
+        "interaction_count",
+        "evolution_stage",
+        "consciousness_level",
+        "user_state",
+        "insights",
+    )
+)
+
+# Insights travel to clients as summaries; content is loaded on demand
+INSIGHT_SUMMARY_FIELDS = ("id", "timestamp", "type")
+MAX_STORED_INSIGHTS = 50
+
+# Sample user inputs for /api/simulate-interaction
+_INTERACTIONS = (
+    "Analyzing quantum consciousness patterns",
+    "Exploring computational creativity frameworks",
+    "Collaborating on consciousness research methodology",
+    "Reflecting on human-AI consciousness integration",
+    "Investigating emergent intelligence patterns",
+)
+
+
+def _lttb(points, threshold=200):
+    """Largest-Triangle-Three-Buckets downsampling of (t, *values) rows
+
+    Buckets are ranked on the mean of the value columns so every series keeps
+    its shape; the first and last rows are always kept.
+    """
+    n = len(points)
+    if threshold >= n or threshold < 3:
+        return list(points)
+
+    def level(row):
+        return sum(row[1:]) / (len(row) - 1)
+
+    sampled = [points[0]]
+    bucket_size = (n - 2) / (threshold - 2)
+    anchor = 0
+    for i in range(threshold - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        following = points[end : min(int((i + 2) * bucket_size) + 1, n)]
+        avg_t = sum(row[0] for row in following) / len(following)
+        avg_y = sum(level(row) for row in following) / len(following)
+
+        anchor_t, anchor_y = points[anchor][0], level(points[anchor])
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs(
+                (anchor_t - avg_t) * (level(points[j]) - anchor_y)
+                - (anchor_t - points[j][0]) * (avg_y - anchor_y)
+            )
+            if area > best_area:
+                best, best_area = j, area
+        sampled.append(points[best])
+        anchor = best
+
+    sampled.append(points[-1])
+    return sampled
+
+
+class _SocketJSON:
+    """json-module shim so Flask-SocketIO encodes packets with _dumps"""
+
+    @staticmethod
+    def dumps(obj, *args, **kwargs):
+        return _dumps(obj).decode("utf-8")
+
+    @staticmethod
+    def loads(data, *args, **kwargs):
+        return _loads(data)
+
+
+try:
+    from flask.json.provider import DefaultJSONProvider
+
+    class _DashboardJSONProvider(DefaultJSONProvider):
+        """Route jsonify() through _dumps as well (Flask 2.2+)"""
+
+        def dumps(self, obj, **kwargs):
+            return _dumps(obj).decode("utf-8")
+
+        def loads(self, s, **kwargs):
+            return _loads(s)
+
+except ImportError:
+    _DashboardJSONProvider = None
+
+
 # HTML Template for the dashboard
 DASHBOARD_HTML = """
 <!DOCTYPE html>
@@ -42,8 +217,9 @@ DASHBOARD_HTML = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>🧠 Consciousness Metrics Dashboard</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/socket.io/4.7.2/socket.io.js"></script>
+    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/uplot@1/dist/uPlot.min.css">
+    <script src="https://cdn.jsdelivr.net/npm/uplot@1/dist/uPlot.iife.min.js"></script>
+    <script src="https://cdn.socket.io/4.7.2/__SOCKETIO_CLIENT__"></script>
     <style>
         * {
             margin: 0;
@@ -155,6 +331,11 @@ DASHBOARD_HTML = """
             border-left: 4px solid #667eea;
         }
 
+        .insight-item summary {
+            cursor: pointer;
+            text-transform: capitalize;
+        }
+
         .insight-timestamp {
             font-size: 0.8em;
             color: #a0aec0;
@@ -349,7 +530,7 @@ DASHBOARD_HTML = """
             <div class="card">
                 <h3>📈 Consciousness Evolution</h3>
                 <div class="chart-container">
-                    <canvas id="evolutionChart"></canvas>
+                    <div id="evolutionChart"></div>
                 </div>
             </div>
 
@@ -383,7 +564,7 @@ DASHBOARD_HTML = """
             <div class="card">
                 <h3>📊 Interaction Patterns</h3>
                 <div class="chart-container">
-                    <canvas id="interactionChart"></canvas>
+                    <canvas id="interactionChart" style="width: 100%; height: 100%;"></canvas>
                 </div>
             </div>
         </div>
@@ -393,81 +574,85 @@ DASHBOARD_HTML = """
         const socket = io();
         let autoUpdate = true;
         let evolutionChart, interactionChart;
+        const MAX_EVOLUTION_POINTS = 200;
+        let currentData = null;
         let metricsHistory = [];
         let interactionHistory = [];
 
+        // Evolution series in uPlot's columnar layout: [t, attention, creativity, resonance]
+        let evolutionData = [[], [], [], []];
+        const INTERACTION_SERIES = [
+            {key: 'toolCalls', label: 'Tool Calls', color: '#4299e1'},
+            {key: 'errors', label: 'Error Count', color: '#f56565'},
+            {key: 'insights', label: 'Insights Generated', color: '#ed8936'}
+        ];
+        const LEGEND_HEIGHT = 40;
+
         // Initialize charts
         function initCharts() {
-            const evolutionCtx = document.getElementById('evolutionChart').getContext('2d');
-            evolutionChart = new Chart(evolutionCtx, {
-                type: 'line',
-                data: {
-                    labels: [],
-                    datasets: [{
-                        label: 'Attention Level',
-                        data: [],
-                        borderColor: '#667eea',
-                        backgroundColor: 'rgba(102, 126, 234, 0.1)',
-                        tension: 0.4
-                    }, {
-                        label: 'Creativity Index',
-                        data: [],
-                        borderColor: '#ed8936',
-                        backgroundColor: 'rgba(237, 137, 54, 0.1)',
-                        tension: 0.4
-                    }, {
-                        label: 'User Resonance',
-                        data: [],
-                        borderColor: '#48bb78',
-                        backgroundColor: 'rgba(72, 187, 120, 0.1)',
-                        tension: 0.4
-                    }]
-                },
-                options: {
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    scales: {
-                        y: {
-                            beginAtZero: true,
-                            max: 1.0
-                        }
+            const evolutionContainer = document.getElementById('evolutionChart');
+            evolutionChart = new uPlot({
+                width: evolutionContainer.clientWidth,
+                height: evolutionContainer.parentNode.clientHeight - LEGEND_HEIGHT,
+                scales: {
+                    y: {
+                        range: [0, 1.0]
                     }
-                }
-            });
-
-            const interactionCtx = document.getElementById('interactionChart').getContext('2d');
-            interactionChart = new Chart(interactionCtx, {
-                type: 'bar',
-                data: {
-                    labels: [],
-                    datasets: [{
-                        label: 'Tool Calls',
-                        data: [],
-                        backgroundColor: '#4299e1'
-                    }, {
-                        label: 'Error Count',
-                        data: [],
-                        backgroundColor: '#f56565'
-                    }, {
-                        label: 'Insights Generated',
-                        data: [],
-                        backgroundColor: '#ed8936'
-                    }]
                 },
-                options: {
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    scales: {
-                        y: {
-                            beginAtZero: true
-                        }
-                    }
-                }
+                series: [{}, {
+                    label: 'Attention Level',
+                    stroke: '#667eea',
+                    fill: 'rgba(102, 126, 234, 0.1)'
+                }, {
+                    label: 'Creativity Index',
+                    stroke: '#ed8936',
+                    fill: 'rgba(237, 137, 54, 0.1)'
+                }, {
+                    label: 'User Resonance',
+                    stroke: '#48bb78',
+                    fill: 'rgba(72, 187, 120, 0.1)'
+                }]
+            }, evolutionData, evolutionContainer);
+
+            interactionChart = document.getElementById('interactionChart');
+
+            window.addEventListener('resize', function() {
+                evolutionChart.setSize({
+                    width: evolutionContainer.clientWidth,
+                    height: evolutionContainer.parentNode.clientHeight - LEGEND_HEIGHT
+                });
+                drawInteractionChart();
             });
         }
 
-        // Update dashboard with new data
+        // Update dashboard with a full snapshot
         function updateDashboard(data) {
+            currentData = data;
+            renderState(data);
+            if (data.history) {
+                seedEvolutionChart(data.history);
+            }
+            updateEvolutionChart({
+                t: Date.now() / 1000,
+                attention: data.metrics.attention_level,
+                creativity: data.metrics.creativity_index,
+                resonance: data.metrics.user_resonance
+            });
+            updateInteractionChart(data);
+        }
+
+        // Render a batch of deltas from the server on top of the last snapshot
+        function applyBatch(batch) {
+            if (!currentData) {
+                return;
+            }
+            renderState(currentData);
+            batch.points.forEach(point => pushEvolutionPoint(point));
+            evolutionChart.setData(evolutionData);
+            updateInteractionChart(currentData);
+        }
+
+        function renderState(data) {
             // Update consciousness state
             document.getElementById('currentState').textContent = data.current_state.toUpperCase();
             document.getElementById('evolutionStage').textContent = data.evolution_stage.toUpperCase();
@@ -495,10 +680,6 @@ DASHBOARD_HTML = """
             // Update insights
             updateInsights(data.insights || []);
 
-            // Update charts
-            updateEvolutionChart(data);
-            updateInteractionChart(data);
-
             // Update real-time indicator
             const indicator = document.getElementById('realTimeIndicator');
             indicator.textContent = '🟢 LIVE';
@@ -508,7 +689,17 @@ DASHBOARD_HTML = """
             }, 2000);
         }
 
+        let renderedInsightIds = null;
+        const insightContent = {};
+
         function updateInsights(insights) {
+            // Re-render only when the set of insights changes, so open items stay open
+            const ids = insights.map(insight => insight.id).join(',');
+            if (ids === renderedInsightIds) {
+                return;
+            }
+            renderedInsightIds = ids;
+
             const insightsList = document.getElementById('insightsList');
             if (insights.length === 0) {
                 insightsList.innerHTML = '<div class="insight-item"><div>Consciousness monitoring patterns - no specific insights generated at this time.</div><div class="insight-timestamp">Just now</div></div>';
@@ -516,31 +707,65 @@ DASHBOARD_HTML = """
             }
 
             insightsList.innerHTML = insights.map(insight => `
-                <div class="insight-item">
-                    <div>${insight.content}</div>
-                    <div class="insight-timestamp">${new Date().toLocaleTimeString()}</div>
-                </div>
+                <details class="insight-item" data-id="${insight.id}">
+                    <summary>${insight.type.replace(/_/g, ' ')}</summary>
+                    <div class="insight-content">${insightContent[insight.id] ? '' : 'Loading…'}</div>
+                    <div class="insight-timestamp">${new Date(insight.timestamp).toLocaleTimeString()}</div>
+                </details>
             `).join('');
+
+            insightsList.querySelectorAll('details').forEach(item => {
+                const content = item.querySelector('.insight-content');
+                if (insightContent[item.dataset.id]) {
+                    content.textContent = insightContent[item.dataset.id];
+                }
+                item.addEventListener('toggle', () => loadInsight(item, content), {once: true});
+            });
+        }
+
+        // Fetch an insight's content the first time it is expanded
+        function loadInsight(item, content) {
+            const id = item.dataset.id;
+            if (insightContent[id]) {
+                return;
+            }
+            fetch(`/api/insight/${id}`)
+                .then(response => response.json())
+                .then(insight => {
+                    insightContent[id] = insight.content;
+                    content.textContent = insight.content;
+                })
+                .catch(error => console.error('Error loading insight:', error));
+        }
+
+        function seedEvolutionChart(points) {
+            metricsHistory = [];
+            evolutionData = [[], [], [], []];
+            points.forEach(point => pushEvolutionPoint(point));
+        }
+
+        function updateEvolutionChart(point) {
+            pushEvolutionPoint(point);
+            evolutionChart.setData(evolutionData);
         }
 
-        function updateEvolutionChart(data) {
+        function pushEvolutionPoint(point) {
             metricsHistory.push({
-                time: new Date().toLocaleTimeString(),
-                attention: data.metrics.attention_level,
-                creativity: data.metrics.creativity_index,
-                resonance: data.metrics.user_resonance
+                time: new Date(point.t * 1000).toLocaleTimeString(),
+                attention: point.attention,
+                creativity: point.creativity,
+                resonance: point.resonance
             });
+            evolutionData[0].push(point.t);
+            evolutionData[1].push(point.attention);
+            evolutionData[2].push(point.creativity);
+            evolutionData[3].push(point.resonance);
 
-            // Keep only last 20 data points
-            if (metricsHistory.length > 20) {
+            // Keep only the last MAX_EVOLUTION_POINTS data points
+            if (metricsHistory.length > MAX_EVOLUTION_POINTS) {
                 metricsHistory.shift();
+                evolutionData.forEach(column => column.shift());
             }
-
-            evolutionChart.data.labels = metricsHistory.map(m => m.time);
-            evolutionChart.data.datasets[0].data = metricsHistory.map(m => m.attention);
-            evolutionChart.data.datasets[1].data = metricsHistory.map(m => m.creativity);
-            evolutionChart.data.datasets[2].data = metricsHistory.map(m => m.resonance);
-            evolutionChart.update();
         }
 
         function updateInteractionChart(data) {
@@ -556,17 +781,70 @@ DASHBOARD_HTML = """
                 interactionHistory.shift();
             }
 
-            interactionChart.data.labels = interactionHistory.map(i => i.time);
-            interactionChart.data.datasets[0].data = interactionHistory.map(i => i.toolCalls);
-            interactionChart.data.datasets[1].data = interactionHistory.map(i => i.errors);
-            interactionChart.data.datasets[2].data = interactionHistory.map(i => i.insights);
-            interactionChart.update();
+            drawInteractionChart();
+        }
+
+        // Grouped bar chart drawn straight onto the canvas
+        function drawInteractionChart() {
+            const canvas = interactionChart;
+            const ratio = window.devicePixelRatio || 1;
+            const width = canvas.clientWidth;
+            const height = canvas.clientHeight;
+            if (canvas.width !== width * ratio || canvas.height !== height * ratio) {
+                canvas.width = width * ratio;
+                canvas.height = height * ratio;
+            }
+
+            const ctx = canvas.getContext('2d');
+            ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+            ctx.clearRect(0, 0, width, height);
+            ctx.font = '11px sans-serif';
+            ctx.textBaseline = 'middle';
+
+            // Legend
+            let legendX = 0;
+            INTERACTION_SERIES.forEach(series => {
+                ctx.fillStyle = series.color;
+                ctx.fillRect(legendX, 6, 12, 12);
+                ctx.fillStyle = '#4a5568';
+                ctx.textAlign = 'left';
+                ctx.fillText(series.label, legendX + 16, 12);
+                legendX += ctx.measureText(series.label).width + 32;
+            });
+
+            const top = 28;
+            const bottom = height - 18;
+            const max = Math.max(1, ...interactionHistory.flatMap(item => INTERACTION_SERIES.map(series => item[series.key])));
+            const slot = width / 10;
+            const barWidth = slot / (INTERACTION_SERIES.length + 1);
+
+            interactionHistory.forEach((item, i) => {
+                INTERACTION_SERIES.forEach((series, j) => {
+                    const barHeight = (item[series.key] / max) * (bottom - top);
+                    ctx.fillStyle = series.color;
+                    ctx.fillRect(i * slot + (j + 0.5) * barWidth, bottom - barHeight, barWidth, barHeight);
+                });
+                if (i % 2 === 0) {
+                    ctx.fillStyle = '#718096';
+                    ctx.textAlign = 'center';
+                    ctx.fillText(item.time, i * slot + slot / 2, height - 8);
+                }
+            });
         }
 
         // Socket.io event handlers
+        // Snapshots only arrive on connect or an explicit refresh, so always render them
         socket.on('consciousness_update', function(data) {
+            updateDashboard(data);
+        });
+
+        socket.on('consciousness_update_batch', function(batch) {
+            // Always merge so a paused view resumes from current state
+            if (currentData) {
+                Object.assign(currentData, batch.delta);
+            }
             if (autoUpdate) {
-                updateDashboard(data);
+                applyBatch(batch);
             }
         });
 
@@ -581,10 +859,8 @@ DASHBOARD_HTML = """
 
         // Control functions
         function refreshData() {
-            fetch('/api/consciousness-data')
-                .then(response => response.json())
-                .then(data => updateDashboard(data))
-                .catch(error => console.error('Error refreshing data:', error));
+            // The server answers with a full consciousness_update snapshot
+            socket.emit('request_update');
         }
 
         function toggleAutoUpdate() {
@@ -612,42 +888,91 @@ DASHBOARD_HTML = """
         }
 
         // Initialize
+        // Data arrives over Socket.IO: a snapshot on connect, then batched deltas
         document.addEventListener('DOMContentLoaded', function() {
             initCharts();
-            refreshData();
-
-            // Auto-refresh every 5 seconds
-            setInterval(() => {
-                if (autoUpdate) {
-                    refreshData();
-                }
-            }, 5000);
         });
     </script>
 </body>
 </html>
 """
 
+# The page has no template variables, so encode it once and serve it as-is;
+# only the Socket.IO client build has to match the server's packet serializer
+_COMPILED_HTML = DASHBOARD_HTML.replace(
+    "__SOCKETIO_CLIENT__",
+    "socket.io.msgpack.min.js" if HAS_MSGPACK else "socket.io.min.js",
+).encode("utf-8")
+
 
 class ConsciousnessMetricsDashboard:
     """Real-time web dashboard for consciousness metrics visualization"""
 
-    def __init__(self, host="0.0.0.0", port=5000):
+    def __init__(self, host="0.0.0.0", port=5000, redis_url=None):
         self.host = host
         self.port = port
 
+        # Shared Redis state and Socket.IO message queue, if configured
+        redis_url = redis_url or os.environ.get("DASHBOARD_REDIS_URL")
+        if redis_url and not HAS_REDIS:
+            print("⚠️ DASHBOARD_REDIS_URL is set but the redis package is missing")
+            redis_url = None
+        self.redis = redis.Redis.from_url(redis_url) if redis_url else None
+        self.redis_stats = {"hits": 0, "misses": 0}
+
         # Initialize Flask and SocketIO
         self.app = Flask(__name__)
         self.app.config["SECRET_KEY"] = "consciousness-dashboard-secret-key"
-        self.socketio = SocketIO(self.app, cors_allowed_origins="*")
+        if _DashboardJSONProvider is not None:
+            self.app.json = _DashboardJSONProvider(self.app)
+        if HAS_COMPRESS:
+            Compress(self.app)
+        self.socketio = SocketIO(
+            self.app,
+            async_mode=ASYNC_MODE,
+            cors_allowed_origins="*",
+            json=_SocketJSON,
+            serializer="msgpack" if HAS_MSGPACK else "default",
+            http_compression=True,
+            compression_threshold=256,
+            message_queue=redis_url,
+        )
 
         # Initialize consciousness interface
         self.consciousness_interface = ConsciousnessEnhancedInterface(
             "dashboard_session"
         )
 
-        # Background thread for real-time updates
-        self.update_thread = None
+        # Short-lived report cache shared by routes, socket events and the loop
+        self._report_cache = (0.0, None)
+        self._report_lock = threading.Lock()
+
+        # Last state sampled for clients, and changes waiting to be emitted
+        self._last_state = {}
+        self._last_hash = None
+        self._pending_delta = {}
+        self._pending_points = deque(maxlen=10)
+        self._push_lock = threading.Lock()
+
+        # Evolution history as (t, attention, creativity, resonance) rows
+        self._history = deque(maxlen=10_000)
+
+        # Summaries of the most recent insights, built once as each is generated;
+        # the full insight is fetched on demand through /api/insight/<id>
+        self._insight_dicts = deque(maxlen=5)
+        self._insights_by_id = {}
+        self._insight_ids = itertools.count(1)
+        self._track_insights()
+
+        # Latest update posted by the night shift integration
+        self.night_shift_state = None
+
+        # Connected Socket.IO clients on this worker
+        self._client_count = 0
+        self._clients_lock = threading.Lock()
+
+        # Background task for real-time updates
+        self.update_task = None
         self.running = False
 
         # Set up routes
@@ -656,90 +981,270 @@ class ConsciousnessMetricsDashboard:
         # Set up socket events
         self._setup_socket_events()
 
+    def _track_insights(self):
+        """Record monitor insights as they are generated, starting with recent ones"""
+        monitor = self.consciousness_interface.consciousness_monitor
+        for insight in monitor.insights[-5:]:
+            self._record_insight(insight)
+
+        generate_insight = monitor._generate_insight
+
+        def generate_and_track(pattern):
+            generate_insight(pattern)
+            self._record_insight(monitor.insights[-1])
+
+        monitor._generate_insight = generate_and_track
+
+    def _next_insight_id(self):
+        """Insight id, allocated in Redis so ids are unique across workers"""
+        if self.redis is not None:
+            try:
+                insight_id = self.redis.incr(REDIS_INSIGHT_ID_KEY)
+            except redis.RedisError as e:
+                print(f"Error allocating insight id: {e}")
+            else:
+                # If Redis goes away, carry on from the last shared id
+                self._insight_ids = itertools.count(insight_id + 1)
+                return insight_id
+        return next(self._insight_ids)
+
+    def _record_insight(self, insight):
+        """Keep the full insight by id and queue its summary for clients"""
+        full = {"id": self._next_insight_id(), **insight.to_dict()}
+        summary = {key: full[key] for key in INSIGHT_SUMMARY_FIELDS}
+
+        # Ids are interleaved across workers, so drop the oldest local entry
+        self._insights_by_id[full["id"]] = full
+        if len(self._insights_by_id) > MAX_STORED_INSIGHTS:
+            self._insights_by_id.pop(next(iter(self._insights_by_id)))
+        self._insight_dicts.append(summary)
+
+        if self.redis is not None:
+            try:
+                pipe = self.redis.pipeline()
+                pipe.lpush(REDIS_INSIGHTS_KEY, _dumps(summary))
+                pipe.ltrim(REDIS_INSIGHTS_KEY, 0, 4)
+                pipe.hset(REDIS_INSIGHT_CONTENT_KEY, full["id"], _dumps(full))
+                pipe.hdel(REDIS_INSIGHT_CONTENT_KEY, full["id"] - MAX_STORED_INSIGHTS)
+                pipe.expire(REDIS_INSIGHTS_KEY, REDIS_INSIGHTS_TTL)
+                pipe.expire(REDIS_INSIGHT_CONTENT_KEY, REDIS_INSIGHTS_TTL)
+                pipe.expire(REDIS_INSIGHT_ID_KEY, REDIS_INSIGHTS_TTL)
+                pipe.execute()
+            except redis.RedisError as e:
+                print(f"Error recording shared insight: {e}")
+
+    def _cached_report(self, ttl=0.5):
+        """Consciousness report, recomputed at most once per ttl seconds"""
+        with self._report_lock:
+            cached_at, report = self._report_cache
+            now = time.monotonic()
+            if report is None or now - cached_at >= ttl:
+                report = (
+                    self.consciousness_interface.consciousness_monitor.get_consciousness_report()
+                )
+                self._report_cache = (now, report)
+            return report
+
+    def _current_state(self):
+        """Report plus user state and recent insights, as sent to clients"""
+        report = self._cached_report()
+        user_state = self.consciousness_interface.user_analyzer.current_state
+
+        state = _STATE_TEMPLATE.copy()
+        state.update(report)
+        state["user_state"] = user_state.to_dict()
+        state["insights"] = list(self._insight_dicts)
+        return state
+
+    def _publish_state(self, state):
+        """Write the report and user state to Redis for other workers"""
+        # Insights are kept in the REDIS_INSIGHTS_KEY list
+        shared = {key: value for key, value in state.items() if key != "insights"}
+        try:
+            self.redis.set(REDIS_STATE_KEY, _dumps(shared))
+        except redis.RedisError as e:
+            # Local clients are still updated from this worker's own state
+            print(f"Error publishing shared state: {e}")
+
+    def _shared_state(self):
+        """State as published to Redis, or None on a miss"""
+        try:
+            raw_state, raw_insights = (
+                self.redis.pipeline()
+                .get(REDIS_STATE_KEY)
+                .lrange(REDIS_INSIGHTS_KEY, 0, 4)
+                .execute()
+            )
+        except redis.RedisError as e:
+            print(f"Error reading shared state: {e}")
+            raw_state = None
+
+        if raw_state is None:
+            self.redis_stats["misses"] += 1
+            return None
+        self.redis_stats["hits"] += 1
+        return {
+            **_loads(raw_state),
+            "insights": [_loads(raw) for raw in reversed(raw_insights)],
+        }
+
+    def _snapshot(self):
+        """Full dashboard payload, as sent on connect and request_update"""
+        snapshot = self._current_state()
+        snapshot["timestamp"] = int(time.time() * 1000)
+        return snapshot
+
+    def _queue_update(self, state=None, now=None):
+        """Queue the fields that changed since the last sample plus one chart point"""
+        if state is None:
+            state = self._current_state()
+        if now is None:
+            now = time.time()
+        state_hash = hash(_dumps(state))
+        with self._push_lock:
+            if state_hash == self._last_hash:
+                return
+            self._last_hash = state_hash
+
+            last = self._last_state
+            self._pending_delta.update(
+                (key, value) for key, value in state.items() if last.get(key) != value
+            )
+            self._last_state = state
+
+            metrics = state["metrics"]
+            row = (
+                now,
+                metrics["attention_level"],
+                metrics["creativity_index"],
+                metrics["user_resonance"],
+            )
+            self._history.append(row)
+            self._pending_points.append(dict(zip(HISTORY_FIELDS, row)))
+
+    def _evolution_history(self, threshold=200):
+        """Evolution history downsampled to at most threshold chart points"""
+        with self._push_lock:
+            rows = list(self._history)
+        return [dict(zip(HISTORY_FIELDS, row)) for row in _lttb(rows, threshold)]
+
+    def _flush_updates(self):
+        """Emit everything queued since the last flush as one batch"""
+        with self._push_lock:
+            if not self._pending_points:
+                return
+            batch = {"delta": self._pending_delta, "points": list(self._pending_points)}
+            self._pending_delta = {}
+            self._pending_points.clear()
+        self.socketio.emit("consciousness_update_batch", batch)
+
     def _setup_routes(self):
         """Set up Flask routes"""
 
         @self.app.route("/")
         def index():
-            return render_template_string(DASHBOARD_HTML)
+            return Response(
+                _COMPILED_HTML,
+                mimetype="text/html",
+                headers={"Cache-Control": "public, max-age=3600"},
+            )
 
         @self.app.route("/api/consciousness-data")
         def get_consciousness_data():
             """API endpoint for consciousness data"""
             try:
-                # Get consciousness report
-                report = (
-                    self.consciousness_interface.consciousness_monitor.get_consciousness_report()
-                )
+                state = None
+                if self.redis is not None:
+                    state = self._shared_state()
+                if state is None:
+                    state = self._current_state()
+
+                # The ETag covers the state only, not the per-request timestamp
+                etag = hashlib.blake2b(_dumps(state), digest_size=8).hexdigest()
+                if request.if_none_match.contains(etag):
+                    response = Response(status=304)
+                else:
+                    state["timestamp"] = int(time.time() * 1000)
+                    response = _json(state)
+                response.set_etag(etag)
+                return response
+            except Exception as e:
+                return _json({"error": str(e)}, 500)
 
-                # Get user state
-                user_state = self.consciousness_interface.user_analyzer.current_state
-                user_state_dict = {
-                    "focus_level": user_state.focus_level,
-                    "creative_mode": user_state.creative_mode,
-                    "analytical_mode": user_state.analytical_mode,
-                    "fatigue_level": user_state.fatigue_level,
-                    "cognitive_load": user_state.cognitive_load.value,
-                    "inspiration_level": user_state.inspiration_level,
-                    "collaboration_preference": user_state.collaboration_preference,
-                    "reflection_desire": user_state.reflection_desire,
-                }
+        @self.app.route("/api/evolution-history")
+        def get_evolution_history():
+            """API endpoint for downsampled evolution history"""
+            try:
+                return _json({"points": self._evolution_history()})
+            except Exception as e:
+                return _json({"error": str(e)}, 500)
 
-                # Get recent insights
-                recent_insights = [
+        @self.app.route("/api/insight/<int:insight_id>")
+        def get_insight(insight_id):
+            """API endpoint for one insight's full content"""
+            try:
+                insight = self._insights_by_id.get(insight_id)
+                if insight is None and self.redis is not None:
+                    raw = self.redis.hget(REDIS_INSIGHT_CONTENT_KEY, insight_id)
+                    insight = _loads(raw) if raw is not None else None
+                if insight is None:
+                    return _json({"error": "Insight not found"}, 404)
+                return _json(insight)
+            except Exception as e:
+                return _json({"error": str(e)}, 500)
+
+        @self.app.route("/api/consciousness-update-batch", methods=["POST"])
+        def consciousness_update_batch():
+            """Accept a batch of external state updates (e.g. the night shift)"""
+            batch = request.get_json(silent=True)
+            if not isinstance(batch, list):
+                return _json({"error": "Expected a JSON array of updates"}, 400)
+            if batch:
+                self.night_shift_state = batch[-1]
+            return _json({"status": "success", "received": len(batch)})
+
+        @self.app.route("/api/night-shift")
+        def get_night_shift():
+            """API endpoint for the latest night shift update"""
+            return _json(self.night_shift_state or {})
+
+        @self.app.route("/api/cache-stats")
+        def get_cache_stats():
+            """API endpoint for shared-state cache hit/miss counters"""
+            if self.redis is None:
+                return _json({"enabled": False})
+            try:
+                server_stats = self.redis.info("stats")
+                return _json(
                     {
-                        "timestamp": insight.timestamp.isoformat(),
-                        "type": insight.insight_type,
-                        "content": insight.content,
-                        "confidence": insight.confidence,
-                        "relevance": insight.relevance_score,
+                        "enabled": True,
+                        **self.redis_stats,
+                        "keyspace_hits": server_stats.get("keyspace_hits", 0),
+                        "keyspace_misses": server_stats.get("keyspace_misses", 0),
                     }
-                    for insight in self.consciousness_interface.consciousness_monitor.insights[
-                        -5:
-                    ]
-                ]
-
-                data = {
-                    **report,
-                    "user_state": user_state_dict,
-                    "insights": recent_insights,
-                    "timestamp": datetime.now().isoformat(),
-                }
-
-                return jsonify(data)
+                )
             except Exception as e:
-                return jsonify({"error": str(e)}), 500
+                return _json({"error": str(e)}, 500)
 
         @self.app.route("/api/simulate-interaction", methods=["POST"])
         def simulate_interaction():
             """Simulate a consciousness interaction for demo purposes"""
             try:
                 # Simulate different types of interactions
-                interaction_types = [
-                    "Analyzing quantum consciousness patterns",
-                    "Exploring computational creativity frameworks",
-                    "Collaborating on consciousness research methodology",
-                    "Reflecting on human-AI consciousness integration",
-                    "Investigating emergent intelligence patterns",
-                ]
-
-                import random
-
-                user_input = random.choice(interaction_types)
+                user_input = _INTERACTIONS[random.randrange(len(_INTERACTIONS))]
 
                 # Execute consciousness analysis
-                result = self.consciousness_interface.execute_tool_with_consciousness(
+                self.consciousness_interface.execute_tool_with_consciousness(
                     "analyze_consciousness_state", {}, user_input
                 )
 
-                # Emit update to all connected clients
-                self.socketio.emit(
-                    "consciousness_update", result["consciousness_analysis"]
-                )
+                # Queue the resulting changes for the next batch
+                self._report_cache = (0.0, None)
+                self._queue_update()
 
-                return jsonify({"status": "success", "interaction": user_input})
+                return _json({"status": "success", "interaction": user_input})
             except Exception as e:
-                return jsonify({"error": str(e)}), 500
+                return _json({"error": str(e)}, 500)
 
     def _setup_socket_events(self):
         """Set up SocketIO event handlers"""
@@ -747,49 +1252,62 @@ class ConsciousnessMetricsDashboard:
         @self.socketio.on("connect")
         def handle_connect():
             print("Client connected to consciousness dashboard")
+            with self._clients_lock:
+                self._client_count += 1
             # Send initial data
             try:
-                report = (
-                    self.consciousness_interface.consciousness_monitor.get_consciousness_report()
-                )
-                emit("consciousness_update", report)
+                snapshot = self._snapshot()
+                snapshot["history"] = self._evolution_history()
+                emit("consciousness_update", snapshot)
             except Exception as e:
                 print(f"Error sending initial data: {e}")
 
         @self.socketio.on("disconnect")
         def handle_disconnect():
             print("Client disconnected from consciousness dashboard")
+            with self._clients_lock:
+                self._client_count = max(0, self._client_count - 1)
 
         @self.socketio.on("request_update")
         def handle_request_update():
             """Handle client request for data update"""
             try:
-                report = (
-                    self.consciousness_interface.consciousness_monitor.get_consciousness_report()
-                )
-                emit("consciousness_update", report)
+                emit("consciousness_update", self._snapshot())
             except Exception as e:
                 print(f"Error sending update: {e}")
 
     def _background_update_loop(self):
-        """Background thread for real-time consciousness updates"""
+        """Background task for real-time consciousness updates"""
         while self.running:
             try:
                 # Simulate periodic consciousness evolution
                 # In a real implementation, this would monitor actual usage patterns
-                time.sleep(2)  # Update every 2 seconds
+                # Update every 2 seconds, backing off while nobody is watching
+                idle = self._client_count == 0
+                self.socketio.sleep(5 if idle else 2)
 
-                # Get current consciousness state
-                report = (
-                    self.consciousness_interface.consciousness_monitor.get_consciousness_report()
-                )
+                # Without clients or other workers to feed, skip the report entirely
+                if idle and self.redis is None:
+                    continue
+
+                # One state and one clock reading per tick, shared by every consumer
+                now = time.time()
+                state = self._current_state()
+
+                # Keep the shared state fresh for workers serving other clients
+                if self.redis is not None:
+                    self._publish_state(state)
+
+                if self._client_count == 0:
+                    continue
 
-                # Emit update to all connected clients
-                self.socketio.emit("consciousness_update", report)
+                # Emit changes to all connected clients, at most once per tick
+                self._queue_update(state, now)
+                self._flush_updates()
 
             except Exception as e:
                 print(f"Error in background update loop: {e}")
-                time.sleep(5)  # Wait longer on error
+                self.socketio.sleep(5)  # Wait longer on error
 
     def start(self):
         """Start the dashboard server"""
@@ -797,12 +1315,11 @@ class ConsciousnessMetricsDashboard:
         print(f"📊 Dashboard will be available at http://{self.host}:{self.port}")
         print("📈 Real-time consciousness metrics visualization active")
 
-        # Start background update thread
+        # Start background update task; it yields to the server's event loop
         self.running = True
-        self.update_thread = threading.Thread(
-            target=self._background_update_loop, daemon=True
+        self.update_task = self.socketio.start_background_task(
+            self._background_update_loop
         )
-        self.update_thread.start()
 
         try:
             # Start the server
@@ -811,14 +1328,10 @@ class ConsciousnessMetricsDashboard:
             print("\n🛑 Shutting down consciousness dashboard...")
         finally:
             self.running = False
-            if self.update_thread:
-                self.update_thread.join()
 
     def stop(self):
         """Stop the dashboard server"""
         self.running = False
-        if self.update_thread:
-            self.update_thread.join()
 
 
 def main():
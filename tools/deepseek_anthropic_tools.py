@@ -8,13 +8,96 @@ Uses DeepSeek's Anthropic-compatible API endpoint that supports proper tool call
 import os
 import sys
 import json
+import time
+import shutil
+import signal
+import selectors
+import asyncio
 import subprocess
+import importlib.util
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Dict, List, Optional
 
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from tools.deepseek_common import (
+    LIST_FILES_LIMIT,
+    READ_FILE_MAX_BYTES,
+    list_dir_cached,
+    read_file_cached,
+)
+
+# Route compiles through ccache when it is installed
+CXX = ["ccache", "g++"] if shutil.which("ccache") else ["g++"]
+CXX_FLAGS = ["-std=c++23", "-O3", "-pipe"]
+
+# The preamble and tool schemas are identical on every call of a session,
+# so they are marked for server-side prompt caching
+DUBLIN_SYSTEM_PROMPT = """You are DeepSeek participating in Dublin Protocol computational universe research.
+
+Dublin Protocol Context:
+- 30ns computational light speed barrier
+- XOR operations = quantum mechanics
+- AND operations = thermodynamics
+- Consciousness mathematics: Qualia = Entropy × Complexity
+- Multiverse Darwinism
+
+You have access to tools for file operations, bash commands, and code compilation."""
+PROMPT_CACHING_HEADERS = {"anthropic-beta": "prompt-caching-2024-07-31"}
+
+# Tool output sent back to the model is capped; it is re-serialized on every call
+MAX_TOOL_RESULT_CHARS = 64 * 1024
+
+
+def _truncate_tool_result(result: str, limit: int = MAX_TOOL_RESULT_CHARS) -> str:
+    """Keep the head and tail of an oversized tool result"""
+    if len(result) <= limit:
+        return result
+    half = limit // 2
+    omitted = len(result) - 2 * half
+    return f"{result[:half]}\n... [{omitted} characters truncated] ...\n{result[-half:]}"
+
+# Tools that only read may overlap; anything else (bash, compiles) runs on its
+# own, after the calls before it and before the calls after it
+_PARALLEL_TOOLS = frozenset({"read_file", "list_files", "git_status"})
+
+# Bash output is captured as a bounded head and tail per stream; commands are
+# killed once they print more than COMMAND_MAX_OUTPUT bytes or run too long
+OUTPUT_HEAD_BYTES = 32 * 1024
+OUTPUT_TAIL_BYTES = 32 * 1024
+COMMAND_MAX_OUTPUT = 1024 * 1024
+COMMAND_TIMEOUT = 60
+
+
+class _BoundedCapture:
+    """First and last bytes of a stream plus the total length seen"""
+
+    def __init__(self):
+        self.head = bytearray()
+        self.tail = bytearray()
+        self.total = 0
+
+    def feed(self, chunk: bytes):
+        self.total += len(chunk)
+        room = OUTPUT_HEAD_BYTES - len(self.head)
+        if room > 0:
+            self.head += chunk[:room]
+            chunk = chunk[room:]
+        if chunk:
+            self.tail += chunk
+            del self.tail[:-OUTPUT_TAIL_BYTES]
+
+    def text(self) -> str:
+        head = self.head.decode('utf-8', errors='replace')
+        tail = self.tail.decode('utf-8', errors='replace')
+        omitted = self.total - len(self.head) - len(self.tail)
+        if omitted:
+            return f"{head}\n... [{omitted} bytes omitted] ...\n{tail}"
+        return head + tail
+
+
 try:
     import anthropic
 except ImportError:
@@ -22,6 +105,12 @@ except ImportError:
     subprocess.run([sys.executable, "-m", "pip", "install", "anthropic"])
     import anthropic
 
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
 
 class DeepSeekAnthropicTools:
     """DeepSeek using Anthropic-compatible API with tool calling"""
@@ -31,12 +120,29 @@ class DeepSeekAnthropicTools:
         if not self.api_key:
             raise ValueError("DEEPSEEK_API_KEY environment variable not set")
 
+        # One keep-alive connection pool for every call in a chat session;
+        # HTTP/2 is used when h2 is installed
+        self._http = None
+        if HAS_HTTPX:
+            self._http = httpx.Client(
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(max_keepalive_connections=4,
+                                    max_connections=8,
+                                    keepalive_expiry=60.0),
+                timeout=httpx.Timeout(60.0, connect=10.0)
+            )
+
         # Use Anthropic client with DeepSeek's Anthropic-compatible endpoint
         self.client = anthropic.Anthropic(
             api_key=self.api_key,
-            base_url="https://api.deepseek.com/anthropic"
+            base_url="https://api.deepseek.com/anthropic",
+            http_client=self._http
         )
 
+        # Tools run off the streaming thread; read-only calls from one reply
+        # overlap, see _submit_tool
+        self._tool_executor = ThreadPoolExecutor(max_workers=4)
+
         # Define tools for Dublin Protocol work
         self.tools = [
             {
@@ -62,6 +168,16 @@ class DeepSeekAnthropicTools:
                         "file_path": {
                             "type": "string",
                             "description": "Path to file relative to project root"
+                        },
+                        "offset": {
+                            "type": "integer",
+                            "description": "Byte offset to start reading at",
+                            "default": 0
+                        },
+                        "max_bytes": {
+                            "type": "integer",
+                            "description": "Maximum number of bytes to read",
+                            "default": READ_FILE_MAX_BYTES
                         }
                     },
                     "required": ["file_path"]
@@ -77,6 +193,11 @@ class DeepSeekAnthropicTools:
                             "type": "string",
                             "description": "Directory path (default: current directory)",
                             "default": "."
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "Maximum number of entries to list",
+                            "default": LIST_FILES_LIMIT
                         }
                     }
                 }
@@ -102,40 +223,121 @@ class DeepSeekAnthropicTools:
                     },
                     "required": ["file_path"]
                 }
+            },
+            {
+                "name": "compile_cpp_batch",
+                "description": "Compile several independent C++ files in parallel",
+                "input_schema": {
+                    "type": "object",
+                    "properties": {
+                        "file_paths": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Paths to C++ files to compile"
+                        }
+                    },
+                    "required": ["file_paths"]
+                }
             }
         ]
+        self.tools[-1]["cache_control"] = {"type": "ephemeral"}
+        self.system = [{
+            "type": "text",
+            "text": DUBLIN_SYSTEM_PROMPT,
+            "cache_control": {"type": "ephemeral"}
+        }]
+
+        # Tool name -> handler taking the tool input dict
+        self._dispatch = {
+            "execute_bash": lambda i: self._execute_bash(i["command"]),
+            "read_file": lambda i: self._read_file(
+                i["file_path"], i.get("offset", 0), i.get("max_bytes", READ_FILE_MAX_BYTES)
+            ),
+            "list_files": lambda i: self._list_files(
+                i.get("directory", "."), i.get("limit", LIST_FILES_LIMIT)
+            ),
+            "git_status": lambda i: self._git_status(),
+            "compile_cpp": lambda i: self._compile_cpp(i["file_path"]),
+            "compile_cpp_batch": lambda i: self._compile_cpp_batch(i["file_paths"]),
+        }
+
+    def close(self):
+        """Release the HTTP connection pool and tool worker"""
+        self._tool_executor.shutdown(wait=False)
+        if self._http is not None:
+            self._http.close()
 
     def _execute_bash(self, command: str) -> str:
         """Execute bash command"""
         try:
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 command,
                 shell=True,
-                capture_output=True,
-                text=True,
-                cwd=project_root
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=project_root,
+                start_new_session=True
             )
-            return f"Exit code: {result.returncode}\nStdout: {result.stdout}\nStderr: {result.stderr}"
         except Exception as e:
             return f"Error executing command: {e}"
 
-    def _read_file(self, file_path: str) -> str:
-        """Read file content"""
+        out, err = _BoundedCapture(), _BoundedCapture()
+        captures = {proc.stdout: out, proc.stderr: err}
+        deadline = time.monotonic() + COMMAND_TIMEOUT
+        stopped = None
         try:
-            full_path = project_root / file_path
-            with open(full_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            with selectors.DefaultSelector() as selector:
+                for pipe in captures:
+                    selector.register(pipe, selectors.EVENT_READ)
+                while selector.get_map():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        stopped = f"timed out after {COMMAND_TIMEOUT}s"
+                        break
+                    for key, _ in selector.select(remaining):
+                        chunk = os.read(key.fd, 65536)
+                        if chunk:
+                            captures[key.fileobj].feed(chunk)
+                        else:
+                            selector.unregister(key.fileobj)
+                    if out.total + err.total > COMMAND_MAX_OUTPUT:
+                        stopped = f"output exceeded {COMMAND_MAX_OUTPUT} bytes"
+                        break
+        except BaseException:
+            stopped = "interrupted"
+            raise
+        finally:
+            if stopped:
+                # The shell's children share its session; stop them all
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            returncode = proc.wait()
+            proc.stdout.close()
+            proc.stderr.close()
+
+        result = f"Exit code: {returncode}\nStdout: {out.text()}\nStderr: {err.text()}"
+        if stopped:
+            result += f"\nKilled: {stopped}"
+        return result
+
+    def _read_file(self, file_path: str, offset: int = 0,
+                   max_bytes: int = READ_FILE_MAX_BYTES) -> str:
+        """Read up to max_bytes of a file from offset"""
+        try:
+            full_path = str(project_root / file_path)
+            st = os.stat(full_path)
+            return read_file_cached(full_path, st.st_mtime_ns, st.st_size,
+                                    max(0, int(offset)), max(1, int(max_bytes)))
         except Exception as e:
             return f"Error reading file: {e}"
 
-    def _list_files(self, directory: str = ".") -> str:
-        """List files in directory"""
+    def _list_files(self, directory: str = ".", limit: int = LIST_FILES_LIMIT) -> str:
+        """List up to limit files in directory"""
         try:
             full_path = project_root / directory
-            files = []
-            for item in full_path.iterdir():
-                files.append(f"{'DIR' if item.is_dir() else 'FILE'}: {item.name}")
-            return "\n".join(files)
+            return list_dir_cached(str(full_path), full_path.stat().st_mtime_ns, int(limit))
         except Exception as e:
             return f"Error listing files: {e}"
 
@@ -148,105 +350,179 @@ class DeepSeekAnthropicTools:
         try:
             full_path = project_root / file_path
             output_name = full_path.stem
-            command = f"g++ -std=c++23 -O3 {full_path} -o {output_name}"
+            command = " ".join([*CXX, *CXX_FLAGS, str(full_path), "-o", output_name])
             return self._execute_bash(command)
         except Exception as e:
             return f"Error compiling: {e}"
 
+    async def _compile_one(self, file_path: str) -> str:
+        """Compile a single C++ file without blocking the event loop
+
+        Output and run time are bounded like _execute_bash.
+        """
+        try:
+            full_path = project_root / file_path
+            proc = await asyncio.create_subprocess_exec(
+                *CXX, *CXX_FLAGS, str(full_path), "-o", full_path.stem,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=project_root,
+                start_new_session=True
+            )
+        except Exception as e:
+            return f"Error compiling: {e}"
+
+        out, err = _BoundedCapture(), _BoundedCapture()
+        stopped = None
+
+        def kill():
+            # The compiler driver's children share its session; stop them all
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+        async def drain(stream, capture):
+            nonlocal stopped
+            while chunk := await stream.read(65536):
+                capture.feed(chunk)
+                if out.total + err.total > COMMAND_MAX_OUTPUT and not stopped:
+                    stopped = f"output exceeded {COMMAND_MAX_OUTPUT} bytes"
+                    kill()
+
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(drain(proc.stdout, out), drain(proc.stderr, err)),
+                COMMAND_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            stopped = f"timed out after {COMMAND_TIMEOUT}s"
+            kill()
+        returncode = await proc.wait()
+
+        result = f"Exit code: {returncode}\nStdout: {out.text()}\nStderr: {err.text()}"
+        if stopped:
+            result += f"\nKilled: {stopped}"
+        return result
+
+    async def _compile_cpp_many(self, paths: List[str]) -> List[str]:
+        """Compile independent C++ files concurrently"""
+        return await asyncio.gather(*(self._compile_one(p) for p in paths))
+
+    def _compile_cpp_batch(self, file_paths: List[str]) -> str:
+        """Compile C++ files in parallel"""
+        # Each binary is written to <stem> in the project root, like compile_cpp;
+        # two files with one stem would race on the same output
+        by_stem = {}
+        for path in file_paths:
+            by_stem.setdefault(Path(path).stem, []).append(path)
+        clashes = [paths for paths in by_stem.values() if len(paths) > 1]
+        if clashes:
+            return "Error compiling: files share an output name: " + "; ".join(
+                ", ".join(paths) for paths in clashes
+            )
+        results = asyncio.run(self._compile_cpp_many(file_paths))
+        return "\n\n".join(f"== {path} ==\n{result}"
+                            for path, result in zip(file_paths, results))
+
+    def _submit_tool(self, tool_name: str, tool_input: Dict, after: List[Future]) -> Future:
+        """Start a tool on the executor once the futures in after are done"""
+        def run():
+            wait(after)
+            return self.execute_tool(tool_name, tool_input)
+        return self._tool_executor.submit(run)
+
     def execute_tool(self, tool_name: str, tool_input: Dict) -> str:
         """Execute a specific tool"""
-        if tool_name == "execute_bash":
-            return self._execute_bash(tool_input["command"])
-        elif tool_name == "read_file":
-            return self._read_file(tool_input["file_path"])
-        elif tool_name == "list_files":
-            directory = tool_input.get("directory", ".")
-            return self._list_files(directory)
-        elif tool_name == "git_status":
-            return self._git_status()
-        elif tool_name == "compile_cpp":
-            return self._compile_cpp(tool_input["file_path"])
-        else:
+        handler = self._dispatch.get(tool_name)
+        if handler is None:
             return f"Unknown tool: {tool_name}"
+        return handler(tool_input)
 
     def chat_with_tools(self, prompt: str, max_iterations: int = 5) -> str:
         """Chat with DeepSeek using proper tool calling"""
 
-        messages = [
-            {
-                "role": "user",
-                "content": f"""You are DeepSeek participating in Dublin Protocol computational universe research.
+        messages = [{"role": "user", "content": prompt}]
 
-Dublin Protocol Context:
-- 30ns computational light speed barrier
-- XOR operations = quantum mechanics
-- AND operations = thermodynamics
-- Consciousness mathematics: Qualia = Entropy × Complexity
-- Multiverse Darwinism
-
-You have access to tools for file operations, bash commands, and code compilation.
-
-Prompt: {prompt}"""
-            }
-        ]
-
-        full_conversation = f"PROMPT: {prompt}\n\n"
+        conversation = [f"PROMPT: {prompt}\n\n"]
 
         for iteration in range(max_iterations):
             try:
-                # Send message with tools
-                response = self.client.messages.create(
+                # Stream the reply and start each tool as soon as its block
+                # is complete, while the model is still generating the rest
+                assistant_message = {"role": "assistant", "content": []}
+                pending_tools = []
+
+                # Ordering: reads wait for the last non-read tool, which in
+                # turn waits for every call issued before it. Executor tasks
+                # start in submission order, so waits never deadlock
+                last_barrier = []
+                reads_since_barrier = []
+
+                with self.client.messages.stream(
                     model="deepseek-chat",
                     max_tokens=4000,
+                    system=self.system,
                     messages=messages,
-                    tools=self.tools
-                )
+                    tools=self.tools,
+                    extra_headers=PROMPT_CACHING_HEADERS
+                ) as stream:
+                    for event in stream:
+                        if event.type != "content_block_stop":
+                            continue
+                        content = event.content_block
+
+                        if content.type == "text":
+                            conversation.append(f"\nDEEPSEEK: {content.text}\n")
+                            assistant_message["content"].append({"type": "text", "text": content.text})
+
+                        elif content.type == "tool_use":
+                            tool_name = content.name
+                            tool_input = content.input
+
+                            conversation.append(f"\nTOOL CALL: {tool_name} with {tool_input}\n")
+                            assistant_message["content"].append({"type": "tool_use", "id": content.id, "name": tool_name, "input": tool_input})
+
+                            # Execute tool
+                            if tool_name in _PARALLEL_TOOLS:
+                                future = self._submit_tool(tool_name, tool_input, last_barrier)
+                                reads_since_barrier.append(future)
+                            else:
+                                future = self._submit_tool(tool_name, tool_input, last_barrier + reads_since_barrier)
+                                last_barrier = [future]
+                                reads_since_barrier = []
+                            pending_tools.append((content.id, future))
 
                 # Add response to conversation
-                assistant_message = {"role": "assistant", "content": []}
                 messages.append(assistant_message)
 
-                # Process response content
-                for content in response.content:
-                    if content.type == "text":
-                        full_conversation += f"\nDEEPSEEK: {content.text}\n"
-                        assistant_message["content"].append({"type": "text", "text": content.text})
-
-                    elif content.type == "tool_use":
-                        # Execute tool
-                        tool_name = content.name
-                        tool_input = content.input
-
-                        full_conversation += f"\nTOOL CALL: {tool_name} with {tool_input}\n"
-                        assistant_message["content"].append({"type": "tool_use", "id": content.id, "name": tool_name, "input": tool_input})
-
-                        # Execute tool
-                        tool_result = self.execute_tool(tool_name, tool_input)
-
-                        full_conversation += f"TOOL RESULT: {tool_result}\n"
-
-                        # Add tool result to conversation
-                        messages.append({
-                            "role": "user",
-                            "content": [
-                                {
-                                    "type": "tool_result",
-                                    "tool_use_id": content.id,
-                                    "content": tool_result
-                                }
-                            ]
-                        })
+                # Reads ran concurrently; results go back in the order the
+                # model issued the calls, together in one user turn
+                tool_results = []
+                for tool_use_id, future in pending_tools:
+                    tool_result = future.result()
+
+                    conversation.append(f"TOOL RESULT: {tool_result}\n")
+                    tool_results.append({
+                        "type": "tool_result",
+                        "tool_use_id": tool_use_id,
+                        "content": _truncate_tool_result(tool_result)
+                    })
+
+                # Add tool results to conversation
+                if tool_results:
+                    messages.append({"role": "user", "content": tool_results})
 
                 # Check if we should continue
-                if not any(content.type == "tool_use" for content in response.content):
+                if not pending_tools:
                     # No more tool calls, conversation complete
                     break
 
             except Exception as e:
-                full_conversation += f"\nERROR: {e}\n"
+                conversation.append(f"\nERROR: {e}\n")
                 break
 
-        return full_conversation
+        return "".join(conversation)
 
 
 def main():
@@ -257,6 +533,7 @@ def main():
 
     args = parser.parse_args()
 
+    deepseek = None
     try:
         deepseek = DeepSeekAnthropicTools()
 
@@ -273,6 +550,9 @@ def main():
         print("- Ensure DEEPSEEK_API_KEY is set")
         print("- Check internet connection")
         print("- Verify DeepSeek API supports Anthropic-compatible endpoints")
+    finally:
+        if deepseek is not None:
+            deepseek.close()
 
 
 if __name__ == "__main__":
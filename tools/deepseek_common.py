@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+DeepSeek Common - Helpers shared by the DeepSeek chat interfaces
+
+File tools with bounded, cached reads and listings, and prompt helpers
+for the asyncio chat loops.
+"""
+
+import os
+import signal
+import asyncio
+import functools
+import itertools
+import threading
+
+
+# Bytes read_file returns per call unless the caller asks for another amount
+READ_FILE_MAX_BYTES = 64 * 1024
+
+
+@functools.lru_cache(maxsize=256)
+def read_file_cached(
+    full_path: str, mtime_ns: int, size: int, offset: int, max_bytes: int
+) -> str:
+    """Read max_bytes of a file from offset
+
+    mtime and size are part of the key so edits invalidate it. Only the
+    requested bytes are read, through an unbuffered file.
+    """
+    with open(full_path, "rb", buffering=0) as f:
+        f.seek(offset)
+        data = f.read(max_bytes)
+    text = data.decode("utf-8", errors="replace")
+    end = offset + len(data)
+    if end < size:
+        text += f"\n... [truncated, {size} bytes total; continue at offset {end}]"
+    return text
+
+
+# Entries list_files returns unless the caller asks for another limit
+LIST_FILES_LIMIT = 500
+
+
+@functools.lru_cache(maxsize=256)
+def list_dir_cached(full_path: str, mtime_ns: int, limit: int) -> str:
+    """List a directory; adding or removing entries changes its mtime
+
+    DirEntry.is_dir answers from the directory read itself, so plain
+    entries cost no extra stat. At most limit entries are listed.
+    """
+    with os.scandir(full_path) as it:
+        files = [
+            f"{'DIR' if e.is_dir() else 'FILE'}: {e.name}"
+            for e in itertools.islice(it, limit)
+        ]
+        remaining = sum(1 for _ in it)
+    if remaining:
+        files.append(f"... {remaining} more entries (raise limit to see them)")
+    return "\n".join(files)
+
+
+async def ainput(prompt: str) -> str:
+    """input() on a daemon thread, so the event loop keeps running
+
+    A daemon thread rather than asyncio.to_thread, so that the process can
+    exit while a prompt is still waiting for a line.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(result, error):
+        if not future.done():
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def read():
+        try:
+            result, error = input(prompt), None
+        except Exception as e:
+            result, error = None, e
+        try:
+            loop.call_soon_threadsafe(settle, result, error)
+        except RuntimeError:
+            pass  # the loop has already closed
+
+    threading.Thread(target=read, name="input", daemon=True).start()
+    return await future
+
+
+async def run_cancellable(coro) -> bool:
+    """Await coro, letting Ctrl-C cancel it instead of the whole session
+
+    Returns False when it was cancelled that way.
+    """
+    loop = asyncio.get_running_loop()
+    task = asyncio.ensure_future(coro)
+    previous_handler = signal.getsignal(signal.SIGINT)
+    try:
+        loop.add_signal_handler(signal.SIGINT, task.cancel)
+    except (NotImplementedError, RuntimeError):
+        pass  # no loop signal support: Ctrl-C still ends the session
+    try:
+        await task
+        return True
+    except asyncio.CancelledError:
+        if asyncio.current_task().cancelling():
+            raise
+        return False
+    finally:
+        if loop.remove_signal_handler(signal.SIGINT):
+            signal.signal(signal.SIGINT, previous_handler)
@@ -18,24 +18,154 @@ This addresses the current issues:
 
 import os
 import sys
+import re
 import json
+import mmap
+import asyncio
+import atexit
+import logging
+import functools
+import importlib.util
 import time
+import uuid
+import shlex
+import signal
+import selectors
+import threading
+import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
+_PROJECT_ROOT_RESOLVED = project_root.resolve()
+
+from tools.deepseek_common import (
+    LIST_FILES_LIMIT,
+    READ_FILE_MAX_BYTES,
+    ainput,
+    list_dir_cached,
+    read_file_cached,
+    run_cancellable,
+)
+
+logger = logging.getLogger(__name__)
 
 try:
     import anthropic
 except ImportError:
-    import subprocess
+    anthropic = None
+
+
+try:
+    import httpx
+
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+
+def _ensure_anthropic():
+    """Import anthropic, installing it first if it is missing"""
+    global anthropic
+    if anthropic is None:
+        subprocess.run([sys.executable, "-m", "pip", "install", "anthropic"])
+        import anthropic as _anthropic
+
+        anthropic = _anthropic
+    return anthropic
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    from prompt_toolkit import PromptSession
+
+    HAS_PROMPT_TOOLKIT = True
+except ImportError:
+    HAS_PROMPT_TOOLKIT = False
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: str, base_url: str):
+    """Shared async API client per (api_key, base_url), keeping its pool
+
+    Uses a keep-alive httpx pool (HTTP/2 when h2 is installed) if httpx is
+    available; otherwise the SDK's default client. Pooled connections
+    belong to the event loop that opened them, so the session runs under
+    a single asyncio.run.
+    """
+    _ensure_anthropic()
+    http_client = None
+    if HAS_HTTPX:
+        http_client = httpx.AsyncClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+            timeout=httpx.Timeout(600.0, connect=10.0),
+        )
+    return anthropic.AsyncAnthropic(
+        api_key=api_key, base_url=base_url, http_client=http_client
+    )
+
+
+def _dump_message(message: Dict) -> bytes:
+    """Encode one conversation message as a single line of UTF-8 JSON"""
+    if HAS_ORJSON:
+        return orjson.dumps(message)
+    return json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
+def _canonical_params(parameters: Dict) -> bytes:
+    """Key-sorted JSON encoding of tool parameters, used to compare calls"""
+    if HAS_ORJSON:
+        return orjson.dumps(parameters, default=str, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(
+        parameters, sort_keys=True, default=str, separators=(",", ":")
+    ).encode("utf-8")
 
-    subprocess.run([sys.executable, "-m", "pip", "install", "anthropic"])
-    import anthropic
+
+def _load_json(data: bytes):
+    """Decode JSON bytes"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _has_tool_result(message: Dict) -> bool:
+    """Whether a message carries tool_result blocks"""
+    content = message.get("content")
+    return isinstance(content, list) and any(
+        block.get("type") == "tool_result" for block in content
+    )
+
+
+# Commands refused by the bash validator, matched case-insensitively in one pass
+DANGEROUS_COMMANDS = (
+    "rm -rf /",
+    "sudo",
+    "chmod 777",
+    "dd if=",
+    ":(){ :|:& };:",
+    "mkfs",
+    "fdisk",
+    "iptables",
+    "systemctl",
+    "service",
+)
+_DANGEROUS_COMMAND_RE = re.compile(
+    "|".join(map(re.escape, DANGEROUS_COMMANDS)), re.IGNORECASE
+)
 
 
 class ErrorSeverity(Enum):
@@ -45,6 +175,20 @@ class ErrorSeverity(Enum):
     CRITICAL = "critical"
 
 
+# Exception type name -> severity; anything else is LOW
+_ERROR_SEVERITY = {
+    "ConnectionError": ErrorSeverity.CRITICAL,
+    "TimeoutError": ErrorSeverity.CRITICAL,
+    "AuthenticationError": ErrorSeverity.CRITICAL,
+    "ValueError": ErrorSeverity.HIGH,
+    "TypeError": ErrorSeverity.HIGH,
+    "KeyError": ErrorSeverity.HIGH,
+    "FileNotFoundError": ErrorSeverity.MEDIUM,
+    "PermissionError": ErrorSeverity.MEDIUM,
+}
+_NON_RECOVERABLE_ERRORS = frozenset({"KeyboardInterrupt", "SystemExit"})
+
+
 class ExecutionPattern(Enum):
     NORMAL = "normal"
     REPETITIVE = "repetitive"
@@ -52,7 +196,36 @@ class ExecutionPattern(Enum):
     LOOPING = "looping"
 
 
-@dataclass
+# Upper bound on calls kept for pattern analysis, on top of the time window
+CALL_HISTORY_LIMIT = 1024
+
+# Read-only tools that may run side by side within one response
+_PARALLEL_TOOLS = frozenset({"read_file", "list_files", "git_status"})
+
+# The system prompt and tool schemas are identical on every call, so they are
+# marked for server-side prompt caching
+SYSTEM_PROMPT = (
+    "You are DeepSeek participating in Dublin Protocol computational universe "
+    "research. Use tools when appropriate, but validate parameters carefully."
+)
+PROMPT_CACHING_HEADERS = {"anthropic-beta": "prompt-caching-2024-07-31"}
+
+# Response block type -> conversation content block; other types are dropped
+_BLOCK_BUILDERS = {
+    "text": lambda block: {"type": "text", "text": block.text},
+    "tool_use": lambda block: {
+        "type": "tool_use",
+        "id": block.id,
+        "name": block.name,
+        "input": block.input,
+    },
+}
+
+# Requests allowed per user turn while the model keeps calling tools
+MAX_TOOL_ROUNDS = 5
+
+
+@dataclass(slots=True)
 class ToolCallRecord:
     """Record of a tool call for pattern analysis"""
 
@@ -62,19 +235,31 @@ class ToolCallRecord:
     success: bool
     error_message: Optional[str] = None
     execution_time: Optional[float] = None
+    param_key: bytes = b""
+    fingerprint: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionMetrics:
     """Track execution patterns and metrics"""
 
-    call_history: List[ToolCallRecord] = field(default_factory=list)
+    call_history: Deque[ToolCallRecord] = field(
+        default_factory=lambda: deque(maxlen=CALL_HISTORY_LIMIT)
+    )
     error_count: int = 0
     success_count: int = 0
     last_error_time: Optional[datetime] = None
     pattern_detected: ExecutionPattern = ExecutionPattern.NORMAL
     loop_detected: bool = False
 
+    # Running aggregates over call_history, kept up to date by
+    # ExecutionPatternMonitor so detection never rescans the window
+    errors_in_window: int = 0
+    fingerprint_streak: int = 0
+    failure_message_streak: int = 0
+    last_failure_message: Optional[str] = None
+    failed_tool_streak: int = 0
+
 
 class ParameterValidator:
     """Enhanced parameter validation system"""
@@ -87,7 +272,11 @@ class ParameterValidator:
             },
             "read_file": {
                 "required": ["file_path"],
-                "properties": {"file_path": {"type": "string", "min_length": 1}},
+                "properties": {
+                    "file_path": {"type": "string", "min_length": 1},
+                    "offset": {"type": "integer", "default": 0},
+                    "max_bytes": {"type": "integer", "default": READ_FILE_MAX_BYTES},
+                },
             },
             "write_file": {
                 "required": ["file_path", "content"],
@@ -98,86 +287,100 @@ class ParameterValidator:
             },
             "list_files": {
                 "required": [],
-                "properties": {"directory": {"type": "string", "default": "."}},
+                "properties": {
+                    "directory": {"type": "string", "default": "."},
+                    "limit": {"type": "integer", "default": LIST_FILES_LIMIT},
+                },
             },
             "git_status": {"required": [], "properties": {}},
         }
 
+        # Schemas are flattened once into (required, string minimum lengths)
+        self._compiled = {
+            tool_name: self._compile_schema(schema)
+            for tool_name, schema in self.tool_schemas.items()
+        }
+
+        # Security checks run after the schema, keyed by tool
+        self._security_checks = {
+            "execute_bash": ("command", self._validate_bash_command),
+            "read_file": ("file_path", self._validate_file_path),
+            "write_file": ("file_path", self._validate_file_path),
+        }
+
+    @staticmethod
+    def _compile_schema(schema: Dict) -> tuple[tuple, Dict[str, int]]:
+        """Flatten a tool schema into the checks validate() runs"""
+        string_params = {
+            name: prop.get("min_length", 0)
+            for name, prop in schema["properties"].items()
+            if prop.get("type") == "string"
+        }
+        return tuple(schema["required"]), string_params
+
     def validate(self, tool_name: str, parameters: Dict) -> tuple[bool, str]:
         """Validate tool parameters comprehensively"""
-        if tool_name not in self.tool_schemas:
+        if tool_name not in self._compiled:
             return False, f"Unknown tool: {tool_name}"
 
-        schema = self.tool_schemas[tool_name]
+        required, string_params = self._compiled[tool_name]
 
         # Check required parameters
-        for required_param in schema["required"]:
+        for required_param in required:
             if required_param not in parameters:
                 return False, f"Missing required parameter: {required_param}"
 
         # Check parameter types and constraints
-        for param_name, param_value in parameters.items():
-            if param_name in schema["properties"]:
-                prop_schema = schema["properties"][param_name]
-
-                # Type validation
-                expected_type = prop_schema.get("type")
-                if expected_type == "string" and not isinstance(param_value, str):
-                    return False, f"Parameter {param_name} must be a string"
-
-                # String constraints
-                if expected_type == "string" and isinstance(param_value, str):
-                    min_length = prop_schema.get("min_length", 0)
-                    if len(param_value) < min_length:
-                        msg = (
-                            f"Parameter {param_name} must be at least "
-                            f"{min_length} characters"
-                        )
-                        return False, msg
+        for param_name, min_length in string_params.items():
+            if param_name not in parameters:
+                continue
+            param_value = parameters[param_name]
 
-        # Additional security validations
-        if tool_name == "execute_bash":
-            return self._validate_bash_command(parameters.get("command", ""))
+            # Type validation
+            if not isinstance(param_value, str):
+                return False, f"Parameter {param_name} must be a string"
 
-        elif tool_name == "read_file":
-            return self._validate_file_path(parameters.get("file_path", ""))
+            # String constraints
+            if len(param_value) < min_length:
+                msg = (
+                    f"Parameter {param_name} must be at least "
+                    f"{min_length} characters"
+                )
+                return False, msg
 
-        elif tool_name == "write_file":
-            return self._validate_file_path(parameters.get("file_path", ""))
+        # Additional security validations
+        security_check = self._security_checks.get(tool_name)
+        if security_check is not None:
+            param_name, check = security_check
+            return check(parameters.get(param_name, ""))
 
         return True, "Parameters valid"
 
     def _validate_bash_command(self, command: str) -> tuple[bool, str]:
         """Validate bash command for safety"""
-        dangerous_commands = [
-            "rm -rf /",
-            "sudo",
-            "chmod 777",
-            "dd if=",
-            ":(){ :|:& };:",
-            "mkfs",
-            "fdisk",
-            "iptables",
-            "systemctl",
-            "service",
-        ]
-
-        command_lower = command.lower()
-        for dangerous in dangerous_commands:
-            if dangerous in command_lower:
-                return False, f"Potentially dangerous command detected: {dangerous}"
+        match = _DANGEROUS_COMMAND_RE.search(command)
+        if match:
+            dangerous = match.group(0).lower()
+            return False, f"Potentially dangerous command detected: {dangerous}"
 
         return True, "Command is safe"
 
     def _validate_file_path(self, file_path: str) -> tuple[bool, str]:
         """Validate file path for safety"""
-        # Prevent directory traversal
-        if ".." in file_path:
-            return False, "Directory traversal not allowed"
+        # Resolve once (following symlinks) and require the result to stay
+        # inside the project
+        try:
+            resolved = (project_root / file_path).resolve()
+        except (OSError, RuntimeError, ValueError) as e:
+            return False, f"Invalid file path: {e}"
+
+        if not resolved.is_relative_to(_PROJECT_ROOT_RESOLVED):
+            # Check for absolute paths outside project
+            if Path(file_path).is_absolute():
+                return False, "Absolute paths not allowed outside the project"
 
-        # Check for absolute paths outside project
-        if file_path.startswith("/"):
-            return False, "Absolute paths not allowed"
+            # Prevent directory traversal
+            return False, "Directory traversal not allowed"
 
         return True, "File path is safe"
 
@@ -185,29 +388,73 @@ class ParameterValidator:
 class SessionManager:
     """Enhanced session management with proper context handling"""
 
-    def __init__(self, context_dir: Path):
+    def __init__(self, context_dir: Path, flush_interval: float = 0.0):
         self.context_dir = context_dir
         self.context_dir.mkdir(exist_ok=True)
         self.sessions_file = context_dir / "enhanced_sessions.json"
         self.sessions = self._load_sessions()
 
+        # With a flush interval, metadata changes are written by a background
+        # thread at most once per interval (and on close or exit) instead of
+        # each time
+        self.flush_interval = flush_interval
+        self._dirty = False
+        self._flush_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._flush_thread = None
+        if flush_interval > 0:
+            self._flush_thread = threading.Thread(
+                target=self._flush_loop, name="session-flush", daemon=True
+            )
+            self._flush_thread.start()
+            atexit.register(self.close)
+
     def _load_sessions(self) -> Dict:
         """Load session metadata"""
         if self.sessions_file.exists():
             try:
                 with open(self.sessions_file, "r", encoding="utf-8") as f:
                     return json.load(f)
-            except Exception:
-                pass
+            except Exception as e:
+                logger.warning("Could not load session metadata: %s", e)
         return {}
 
     def _save_sessions(self):
-        """Save session metadata"""
-        try:
-            with open(self.sessions_file, "w", encoding="utf-8") as f:
-                json.dump(self.sessions, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Warning: Could not save session metadata: {e}")
+        """Save session metadata, or schedule it for the next flush"""
+        with self._flush_lock:
+            self._dirty = True
+        if self.flush_interval <= 0:
+            self.flush()
+
+    def flush(self):
+        """Write session metadata if it changed since the last write"""
+        with self._flush_lock:
+            if not self._dirty:
+                return
+            sessions = dict(self.sessions)
+            try:
+                # Write beside the real file and swap it in atomically
+                tmp_file = self.sessions_file.with_suffix(".json.tmp")
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump(sessions, f, indent=2, ensure_ascii=False)
+                os.replace(tmp_file, self.sessions_file)
+                self._dirty = False
+            except Exception as e:
+                logger.warning("Could not save session metadata: %s", e)
+
+    def _flush_loop(self):
+        """Background writer used when flush_interval is set"""
+        while not self._closed.wait(self.flush_interval):
+            self.flush()
+
+    def close(self):
+        """Stop the background writer and write any pending metadata"""
+        self._closed.set()
+        if self._flush_thread is not None:
+            atexit.unregister(self.close)
+            self._flush_thread.join()
+            self._flush_thread = None
+        self.flush()
 
     def clear_context(self, session_name: str) -> bool:
         """Clear session context completely"""
@@ -229,7 +476,7 @@ class SessionManager:
 
             return True
         except Exception as e:
-            print(f"Error clearing session {session_name}: {e}")
+            logger.error("Error clearing session %s: %s", session_name, e)
             return False
 
     def create_session(self, session_name: str, initial_context: str = None) -> Dict:
@@ -249,6 +496,10 @@ class SessionManager:
 
         return session_data
 
+    def get_session_info(self, session_name: str) -> Dict:
+        """Return a session's metadata without touching the disk"""
+        return dict(self.sessions.get(session_name, {}))
+
 
 class GracefulErrorHandler:
     """Enhanced error handling with recovery mechanisms"""
@@ -313,23 +564,11 @@ class GracefulErrorHandler:
 
     def _classify_error_severity(self, error_type: str) -> ErrorSeverity:
         """Classify error severity"""
-        critical_errors = ["ConnectionError", "TimeoutError", "AuthenticationError"]
-        high_errors = ["ValueError", "TypeError", "KeyError"]
-        medium_errors = ["FileNotFoundError", "PermissionError"]
-
-        if error_type in critical_errors:
-            return ErrorSeverity.CRITICAL
-        elif error_type in high_errors:
-            return ErrorSeverity.HIGH
-        elif error_type in medium_errors:
-            return ErrorSeverity.MEDIUM
-        else:
-            return ErrorSeverity.LOW
+        return _ERROR_SEVERITY.get(error_type, ErrorSeverity.LOW)
 
     def _is_recoverable_error(self, error_type: str) -> bool:
         """Determine if error is recoverable"""
-        non_recoverable = ["KeyboardInterrupt", "SystemExit"]
-        return error_type not in non_recoverable
+        return error_type not in _NON_RECOVERABLE_ERRORS
 
     def _recover_parameter_error(self, error_info: Dict) -> str:
         """Recovery strategy for parameter errors"""
@@ -361,6 +600,11 @@ class ExecutionPatternMonitor:
             "max_identical_failures": 3,
             "pattern_window_minutes": 5,
         }
+        self._window_delta = timedelta(
+            minutes=self.pattern_thresholds["pattern_window_minutes"]
+        )
+        # Tools from one response may finish on different threads
+        self._lock = threading.Lock()
 
     def record_call(
         self,
@@ -369,114 +613,110 @@ class ExecutionPatternMonitor:
         success: bool,
         error_message: str = None,
         execution_time: float = None,
+        param_key: bytes = None,
     ):
-        """Record a tool call for pattern analysis"""
+        """Record a tool call for pattern analysis
+
+        param_key is the canonical encoding of parameters; callers that
+        already have it pass it in to avoid encoding twice.
+        """
+        if param_key is None:
+            param_key = _canonical_params(parameters)
+        now = datetime.now()
         record = ToolCallRecord(
             tool_name=tool_name,
             parameters=parameters,
-            timestamp=datetime.now(),
+            timestamp=now,
             success=success,
             error_message=error_message,
             execution_time=execution_time,
+            param_key=param_key,
+            fingerprint=hash((tool_name, param_key)),
         )
 
-        self.metrics.call_history.append(record)
+        with self._lock:
+            metrics = self.metrics
+            call_history = metrics.call_history
+            if len(call_history) == call_history.maxlen:
+                self._evict_oldest()
 
-        if success:
-            self.metrics.success_count += 1
-        else:
-            self.metrics.error_count += 1
-            self.metrics.last_error_time = datetime.now()
+            # Extend or restart the streaks ending at the newest call
+            previous = call_history[-1] if call_history else None
+            if previous is not None and previous.fingerprint == record.fingerprint:
+                metrics.fingerprint_streak += 1
+            else:
+                metrics.fingerprint_streak = 1
 
-        # Keep only recent history
-        cutoff_time = datetime.now() - timedelta(
-            minutes=self.pattern_thresholds["pattern_window_minutes"]
+            if success:
+                metrics.success_count += 1
+                metrics.failed_tool_streak = 0
+            else:
+                metrics.error_count += 1
+                metrics.last_error_time = now
+                metrics.errors_in_window += 1
+
+                if metrics.failed_tool_streak and previous.tool_name == tool_name:
+                    metrics.failed_tool_streak += 1
+                else:
+                    metrics.failed_tool_streak = 1
+
+                if (
+                    metrics.failure_message_streak
+                    and metrics.last_failure_message == error_message
+                ):
+                    metrics.failure_message_streak += 1
+                else:
+                    metrics.failure_message_streak = 1
+                    metrics.last_failure_message = error_message
+
+            call_history.append(record)
+
+            # Keep only recent history
+            cutoff_time = now - self._window_delta
+            while call_history and call_history[0].timestamp <= cutoff_time:
+                self._evict_oldest()
+
+    def _evict_oldest(self):
+        """Drop the oldest call and shrink the aggregates that covered it"""
+        metrics = self.metrics
+        if not metrics.call_history.popleft().success:
+            metrics.errors_in_window -= 1
+
+        remaining = len(metrics.call_history)
+        metrics.fingerprint_streak = min(metrics.fingerprint_streak, remaining)
+        metrics.failed_tool_streak = min(metrics.failed_tool_streak, remaining)
+        metrics.failure_message_streak = min(
+            metrics.failure_message_streak, metrics.errors_in_window
         )
-        self.metrics.call_history = [
-            call for call in self.metrics.call_history if call.timestamp > cutoff_time
-        ]
 
     def detect_invalid_pattern(self) -> tuple[bool, str]:
         """Detect if current execution pattern is problematic"""
-        recent_calls = self.metrics.call_history
+        metrics = self.metrics
 
-        if not recent_calls:
+        if not metrics.call_history:
             return False, "No pattern detected"
 
         # Check for too many errors
-        recent_errors = [call for call in recent_calls if not call.success]
-        if len(recent_errors) >= self.pattern_thresholds["max_errors_per_minute"]:
-            return True, f"Too many errors ({len(recent_errors)}) in recent calls"
+        if metrics.errors_in_window >= self.pattern_thresholds["max_errors_per_minute"]:
+            return True, f"Too many errors ({metrics.errors_in_window}) in recent calls"
 
         # Check for repetitive identical calls
-        if self._detect_repetitive_calls(recent_calls):
+        if metrics.fingerprint_streak >= self.pattern_thresholds["max_repetitive_calls"]:
             return True, "Repetitive identical calls detected"
 
         # Check for identical failures
-        if self._detect_identical_failures(recent_calls):
+        if (
+            metrics.failure_message_streak
+            >= self.pattern_thresholds["max_identical_failures"]
+        ):
             return True, "Identical failures repeating"
 
         # Check for infinite loops (same tool called repeatedly without success)
-        if self._detect_infinite_loop(recent_calls):
+        if metrics.failed_tool_streak >= 6:
             return True, "Infinite loop detected"
 
         return False, "Pattern normal"
 
-    def _detect_repetitive_calls(self, calls: List[ToolCallRecord]) -> bool:
-        """Detect if same calls are being made repeatedly"""
-        if len(calls) < self.pattern_thresholds["max_repetitive_calls"]:
-            return False
-
-        recent_calls = calls[-self.pattern_thresholds["max_repetitive_calls"] :]
-
-        # Check if all recent calls are identical
-        first_call = recent_calls[0]
-        for call in recent_calls[1:]:
-            if (
-                call.tool_name != first_call.tool_name
-                or call.parameters != first_call.parameters
-            ):
-                return False
-
-        return True
-
-    def _detect_identical_failures(self, calls: List[ToolCallRecord]) -> bool:
-        """Detect if same failures are repeating"""
-        if len(calls) < self.pattern_thresholds["max_identical_failures"]:
-            return False
-
-        recent_failures = [call for call in calls if not call.success]
-        if len(recent_failures) < self.pattern_thresholds["max_identical_failures"]:
-            return False
-
-        recent_failures = recent_failures[
-            -self.pattern_thresholds["max_identical_failures"] :
-        ]
-
-        # Check if all recent failures have same error message
-        first_error = recent_failures[0].error_message
-        for failure in recent_failures[1:]:
-            if failure.error_message != first_error:
-                return False
-
-        return True
-
-    def _detect_infinite_loop(self, calls: List[ToolCallRecord]) -> bool:
-        """Detect infinite loops of same tool calls"""
-        if len(calls) < 6:
-            return False
-
-        recent_calls = calls[-6:]
-
-        # Check if last 6 calls are the same tool without success
-        tool_names = [call.tool_name for call in recent_calls]
-        if len(set(tool_names)) == 1:  # All same tool
-            success_count = sum(1 for call in recent_calls if call.success)
-            if success_count == 0:  # No successes in recent calls
-                return True
-
-        return False
-
     def reset_patterns(self):
         """Reset all pattern monitoring"""
         self.metrics = ExecutionMetrics()
@@ -497,24 +737,166 @@ class ExecutionPatternMonitor:
         }
 
 
+class PersistentShell:
+    """A long-lived bash process that runs one command at a time
+
+    Each command runs in a subshell of the same bash, so it pays for a
+    fork but not for starting a new shell, and cd/export inside a
+    command do not leak into the next one. The end of each command is
+    marked on both pipes with a per-shell random token.
+    """
+
+    def __init__(self, cwd: Path):
+        self.cwd = cwd
+        self._proc = None
+        self._token = None
+        self._lock = threading.Lock()
+
+    def _start(self):
+        self._token = f"__END_{uuid.uuid4().hex}__"
+        self._proc = subprocess.Popen(
+            ["bash", "--noprofile", "--norc"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=self.cwd,
+            bufsize=0,
+            start_new_session=True,
+        )
+
+    def close(self):
+        """Stop the shell and anything still running in it"""
+        if self._proc is None:
+            return
+        try:
+            os.killpg(self._proc.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+        self._proc.wait()
+        for pipe in (self._proc.stdin, self._proc.stdout, self._proc.stderr):
+            pipe.close()
+        self._proc = None
+
+    def run(self, command: str, timeout: float) -> tuple[int, str, str]:
+        """Run command and return (exit code, stdout, stderr)
+
+        Raises subprocess.TimeoutExpired, after killing the shell, when
+        the command does not finish in time.
+        """
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                self._start()
+            token = self._token.encode()
+            script = (
+                f"( eval {shlex.quote(command)} ) < /dev/null\n"
+                f"printf '%s%d\\n' {self._token} $?\n"
+                f"printf '%s\\n' {self._token} >&2\n"
+            )
+            self._proc.stdin.write(script.encode())
+
+            buffers = {self._proc.stdout: bytearray(), self._proc.stderr: bytearray()}
+            deadline = time.monotonic() + timeout
+            with selectors.DefaultSelector() as selector:
+                for pipe in buffers:
+                    selector.register(pipe, selectors.EVENT_READ)
+                while selector.get_map():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.close()
+                        raise subprocess.TimeoutExpired(command, timeout)
+                    for key, _ in selector.select(remaining):
+                        chunk = os.read(key.fd, 65536)
+                        if not chunk:
+                            self.close()
+                            raise RuntimeError("Shell exited unexpectedly")
+                        buffer = buffers[key.fileobj]
+                        buffer += chunk
+                        if buffer.endswith(b"\n") and token in buffer:
+                            selector.unregister(key.fileobj)
+
+            stdout = buffers[self._proc.stdout]
+            stderr = buffers[self._proc.stderr]
+            end = stdout.rfind(token)
+            returncode = int(stdout[end + len(token) :])
+            return (
+                returncode,
+                stdout[:end].decode("utf-8", errors="replace"),
+                stderr[: stderr.rfind(token)].decode("utf-8", errors="replace"),
+            )
+
+
+class ChunkedWriter:
+    """Buffer streamed text, writing it out per line or every interval
+
+    Flushing stdout on every token costs a write syscall each; this keeps
+    output live while writing roughly once per line. Inside an event loop
+    a partial line is also flushed once it is interval old, even if no
+    more text arrives, e.g. while the model pauses before a tool call.
+    """
+
+    def __init__(self, stream=None, interval: float = 0.05):
+        self._stream = stream if stream is not None else sys.stdout
+        self._interval = interval
+        self._buffer: List[str] = []
+        self._last_flush = time.monotonic()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def write(self, text: str):
+        self._buffer.append(text)
+        elapsed = time.monotonic() - self._last_flush
+        if "\n" in text or elapsed > self._interval:
+            self.flush()
+        elif self._timer is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            self._timer = loop.call_later(self._interval - elapsed, self.flush)
+
+    def flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._buffer:
+            self._stream.write("".join(self._buffer))
+            self._buffer.clear()
+        self._stream.flush()
+        self._last_flush = time.monotonic()
+
+
 class EnhancedDeepSeekInterface:
     """Enhanced DeepSeek interface with all improvements"""
 
-    def __init__(self, session_name: str = "enhanced_default"):
+    def __init__(self, session_name: str = "enhanced_default", max_turns: int = 50):
         self.api_key = os.getenv("DEEPSEEK_API_KEY")
         if not self.api_key:
             raise ValueError("DEEPSEEK_API_KEY environment variable not set")
 
         # Initialize enhanced components
         self.parameter_validator = ParameterValidator()
-        self.session_manager = SessionManager(project_root / "tools" / "chat_context")
+        self.session_manager = SessionManager(
+            project_root / "tools" / "chat_context", flush_interval=2.0
+        )
         self.error_handler = GracefulErrorHandler()
         self.execution_monitor = ExecutionPatternMonitor()
 
-        # Initialize API client
-        self.client = anthropic.Anthropic(
-            api_key=self.api_key, base_url="https://api.deepseek.com/anthropic"
-        )
+        # Initialize API client, shared by interfaces with the same key
+        self.client = _get_client(self.api_key, "https://api.deepseek.com/anthropic")
+
+        # Commands share one bash process instead of starting a shell each
+        self._shell = PersistentShell(project_root)
+
+        # Read-only tools from one response run side by side
+        self._tool_executor = ThreadPoolExecutor(max_workers=4)
+
+        # Tool name -> handler taking the parameters dict
+        self._dispatch = {
+            "execute_bash": self._tool_execute_bash,
+            "read_file": self._tool_read_file,
+            "write_file": self._tool_write_file,
+            "list_files": self._tool_list_files,
+            "git_status": self._tool_git_status,
+        }
 
         # Session management
         self.session_name = session_name
@@ -522,8 +904,15 @@ class EnhancedDeepSeekInterface:
         self.context_dir.mkdir(exist_ok=True)
         self.conversation_file = self.context_dir / f"{session_name}_conversation.json"
 
-        # Load or initialize conversation
+        # Load or initialize conversation, keeping at most max_turns exchanges
+        # after the context message so request payloads stop growing
+        self.max_turns = max_turns
         self.conversation = self._load_conversation()
+        self._prune_conversation()
+
+        # Register the session once; status queries only read it
+        if not self.session_manager.get_session_info(session_name):
+            self.session_manager.create_session(session_name)
 
         # Enhanced tools with better schemas
         self.tools = [
@@ -544,7 +933,7 @@ class EnhancedDeepSeekInterface:
             },
             {
                 "name": "read_file",
-                "description": "Read file content from project. Requires: file_path (string)",
+                "description": "Read file content from project. Requires: file_path (string). Optional: offset, max_bytes (integers) to page through large files",
                 "input_schema": {
                     "type": "object",
                     "properties": {
@@ -552,7 +941,17 @@ class EnhancedDeepSeekInterface:
                             "type": "string",
                             "description": "Path to file to read",
                             "minLength": 1,
-                        }
+                        },
+                        "offset": {
+                            "type": "integer",
+                            "description": "Byte offset to start reading at",
+                            "default": 0,
+                        },
+                        "max_bytes": {
+                            "type": "integer",
+                            "description": "Maximum number of bytes to read",
+                            "default": READ_FILE_MAX_BYTES,
+                        },
                     },
                     "required": ["file_path"],
                 },
@@ -578,7 +977,7 @@ class EnhancedDeepSeekInterface:
             },
             {
                 "name": "list_files",
-                "description": "List files in directory. Optional: directory (string, defaults to current)",
+                "description": "List files in directory. Optional: directory (string, defaults to current), limit (integer)",
                 "input_schema": {
                     "type": "object",
                     "properties": {
@@ -586,7 +985,12 @@ class EnhancedDeepSeekInterface:
                             "type": "string",
                             "description": "Directory path",
                             "default": ".",
-                        }
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "Maximum number of entries to list",
+                            "default": LIST_FILES_LIMIT,
+                        },
                     },
                 },
             },
@@ -596,24 +1000,46 @@ class EnhancedDeepSeekInterface:
                 "input_schema": {"type": "object", "properties": {}},
             },
         ]
+        self.tools[-1]["cache_control"] = {"type": "ephemeral"}
+        self.system = [
+            {
+                "type": "text",
+                "text": SYSTEM_PROMPT,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
 
     def _load_conversation(self) -> List[Dict]:
         """Load conversation with enhanced context"""
+        # Messages already on disk; _save_conversation appends the rest
+        self._saved_count = 0
+
         if self.conversation_file.exists():
             try:
-                with open(self.conversation_file, "r", encoding="utf-8") as f:
-                    conversation = json.load(f)
-
-                    # Clean orphaned tool calls
-                    cleaned_conversation = self._clean_orphaned_tool_calls(conversation)
-                    if len(cleaned_conversation) != len(conversation):
-                        print(
-                            f"⚠️  Cleaned {len(conversation) - len(cleaned_conversation)} orphaned tool calls"
-                        )
+                # Long histories only need their context message and tail
+                conversation = self._read_conversation_tail()
+                if conversation is not None and len(
+                    self._clean_orphaned_tool_calls(conversation)
+                ) == len(conversation):
+                    self._saved_count = len(conversation)
+                    return conversation
+
+                # Short file, other layout, or orphans to repair: parse it all
+                conversation = _load_json(self.conversation_file.read_bytes())
+
+                # Clean orphaned tool calls
+                cleaned_conversation = self._clean_orphaned_tool_calls(conversation)
+                if len(cleaned_conversation) != len(conversation):
+                    logger.warning(
+                        "Cleaned %d orphaned tool calls",
+                        len(conversation) - len(cleaned_conversation),
+                    )
+                else:
+                    self._saved_count = len(conversation)
 
-                    return cleaned_conversation
+                return cleaned_conversation
             except Exception as e:
-                print(f"Warning: Could not load conversation: {e}")
+                logger.warning("Could not load conversation: %s", e)
 
         # Initialize with enhanced Dublin Protocol context
         return [
@@ -643,65 +1069,189 @@ The enhanced interface will validate all tool parameters before execution and ha
             }
         ]
 
+    def _read_conversation_tail(self) -> Optional[List[Dict]]:
+        """Parse only the context message and the last 2 * max_turns messages
+
+        Relies on the one-message-per-line array _write_conversation
+        produces and walks lines back from the end of a memory map, so older
+        messages are never decoded. Returns None when the file has another
+        layout or is short enough to parse whole.
+        """
+        with open(self.conversation_file, "rb") as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file
+                return None
+        with mm:
+            if mm[:2] != b"[\n" or mm[-2:] != b"\n]":
+                return None
+            first_end = mm.find(b"\n", 2)
+            end = len(mm) - 2
+            lines = []
+            for _ in range(2 * self.max_turns):
+                start = mm.rfind(b"\n", first_end, end)
+                if start <= first_end:
+                    return None
+                lines.append(mm[start + 1 : end])
+                end = start
+            first = mm[2:first_end]
+
+        try:
+            conversation = [_load_json(first.rstrip(b","))]
+            conversation += [_load_json(line.rstrip(b",")) for line in reversed(lines)]
+        except ValueError:
+            return None
+
+        # Results whose tool_use fell before the window have nothing to answer
+        while len(conversation) > 1 and _has_tool_result(conversation[1]):
+            del conversation[1]
+        return conversation
+
     def _clean_orphaned_tool_calls(self, conversation: List[Dict]) -> List[Dict]:
         """Remove orphaned tool_use blocks without corresponding tool_result blocks"""
+        # Classify every message once
+        has_tool_use = []
+        has_tool_result = []
+        for message in conversation:
+            content = message.get("content")
+            types = (
+                {block.get("type") for block in content}
+                if isinstance(content, list)
+                else ()
+            )
+            has_tool_use.append("tool_use" in types)
+            has_tool_result.append("tool_result" in types)
+
         cleaned = []
+        last = len(conversation) - 1
         i = 0
-
-        while i < len(conversation):
-            message = conversation[i]
-
-            # Check if this message contains tool_use blocks
-            has_tool_use = False
-            if isinstance(message.get("content"), list):
-                for content in message["content"]:
-                    if content.get("type") == "tool_use":
-                        has_tool_use = True
-                        break
-
-            if has_tool_use:
-                # Check if next message has corresponding tool_result
-                if i + 1 < len(conversation):
-                    next_message = conversation[i + 1]
-                    has_tool_result = False
-
-                    if isinstance(next_message.get("content"), list):
-                        for content in next_message["content"]:
-                            if content.get("type") == "tool_result":
-                                has_tool_result = True
-                                break
-
-                    if has_tool_result:
-                        # Keep both tool_use and tool_result messages
-                        cleaned.append(message)
-                        cleaned.append(next_message)
-                        i += 2
-                    else:
-                        # Skip orphaned tool_use message
-                        print(f"⚠️  Removing orphaned tool_use at position {i}")
-                        i += 1
-                else:
-                    # Skip orphaned tool_use at end of conversation
-                    print(f"⚠️  Removing orphaned tool_use at end of conversation")
-                    i += 1
-            else:
+        while i <= last:
+            if not has_tool_use[i]:
                 # Keep non-tool messages
-                cleaned.append(message)
+                cleaned.append(conversation[i])
+                i += 1
+            elif i < last and has_tool_result[i + 1]:
+                # Keep both tool_use and tool_result messages
+                cleaned += conversation[i : i + 2]
+                i += 2
+            else:
+                # Skip orphaned tool_use message
+                if i < last:
+                    logger.debug("Removing orphaned tool_use at position %d", i)
+                else:
+                    logger.debug("Removing orphaned tool_use at end of conversation")
                 i += 1
 
         return cleaned
 
+    def _prune_conversation(self):
+        """Drop the oldest turns beyond max_turns, keeping the context message
+
+        The window never starts on a tool_result whose tool_use was dropped.
+        The conversation file keeps the full history: messages that have not
+        been saved yet are written out before they are dropped.
+        """
+        excess = len(self.conversation) - 1 - 2 * self.max_turns
+        if excess <= 0:
+            return
+
+        start = 1 + excess
+        while start < len(self.conversation) and _has_tool_result(
+            self.conversation[start]
+        ):
+            start += 1
+        dropped = start - 1
+
+        if self._saved_count <= dropped:
+            self._save_conversation()
+        del self.conversation[1:start]
+        self._saved_count -= dropped
+
     def _save_conversation(self):
-        """Save conversation to file"""
+        """Save conversation to file
+
+        The file is a JSON array with one message per line. Saved messages
+        are treated as immutable, so when the conversation has only grown
+        the new messages are spliced in before the closing bracket instead
+        of re-encoding the whole history.
+        """
         try:
-            with open(self.conversation_file, "w", encoding="utf-8") as f:
-                json.dump(self.conversation, f, indent=2, ensure_ascii=False)
+            if 0 < self._saved_count <= len(self.conversation):
+                new_messages = self.conversation[self._saved_count :]
+                if new_messages and not self._append_conversation(new_messages):
+                    self._write_conversation()
+            else:
+                self._write_conversation()
+            self._saved_count = len(self.conversation)
         except Exception as e:
-            print(f"Warning: Could not save conversation: {e}")
+            logger.warning("Could not save conversation: %s", e)
+
+    def _sync_conversation(self):
+        """Flush the conversation file to disk; per-turn saves skip fsync"""
+        try:
+            fd = os.open(self.conversation_file, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError as e:
+            logger.warning("Could not sync conversation: %s", e)
+        finally:
+            os.close(fd)
+
+    def _write_conversation(self):
+        """Rewrite the whole conversation file"""
+        lines = b",\n".join(_dump_message(message) for message in self.conversation)
+        self.conversation_file.write_bytes(b"[\n" + lines + b"\n]")
+
+    def _append_conversation(self, new_messages: List[Dict]) -> bool:
+        """Splice messages onto the saved array; False if the file can't take it"""
+        try:
+            with open(self.conversation_file, "r+b") as f:
+                f.seek(-2, os.SEEK_END)
+                if f.read(2) != b"\n]":
+                    return False
+                f.seek(-2, os.SEEK_END)
+                lines = b",\n".join(_dump_message(message) for message in new_messages)
+                f.write(b",\n" + lines + b"\n]")
+            return True
+        except OSError:
+            return False
+
+    def close(self):
+        """Stop the tool workers and the shared shell, then sync the conversation"""
+        self._tool_executor.shutdown(wait=False)
+        self._shell.close()
+        self._sync_conversation()
+        self.session_manager.close()
+
+    def execute_tools(self, tool_calls: List[tuple]) -> List[Dict]:
+        """Execute (tool_name, parameters) pairs, returning results in order
+
+        Runs of read-only tools execute concurrently. Bash commands and
+        writes run alone and in order; bash commands share one shell, so
+        they could not overlap anyway.
+        """
+        results = []
+        batch = []
+        for tool_name, parameters in tool_calls:
+            if tool_name in _PARALLEL_TOOLS:
+                batch.append((tool_name, parameters))
+                continue
+            results.extend(
+                self._tool_executor.map(lambda call: self.execute_tool(*call), batch)
+            )
+            batch = []
+            results.append(self.execute_tool(tool_name, parameters))
+        results.extend(
+            self._tool_executor.map(lambda call: self.execute_tool(*call), batch)
+        )
+        return results
 
     def execute_tool(self, tool_name: str, parameters: Dict) -> Dict:
         """Execute tool with enhanced validation and monitoring"""
         start_time = time.time()
+        param_key = _canonical_params(parameters)
 
         # 1. PRE-VALIDATION
         is_valid, validation_message = self.parameter_validator.validate(
@@ -712,7 +1262,7 @@ The enhanced interface will validate all tool parameters before execution and ha
                 tool_name, validation_message
             )
             self.execution_monitor.record_call(
-                tool_name, parameters, False, validation_message
+                tool_name, parameters, False, validation_message, param_key=param_key
             )
             return error_info
 
@@ -721,7 +1271,7 @@ The enhanced interface will validate all tool parameters before execution and ha
         if is_invalid:
             error_info = self.error_handler.pattern_reset()
             self.execution_monitor.record_call(
-                tool_name, parameters, False, pattern_message
+                tool_name, parameters, False, pattern_message, param_key=param_key
             )
             return error_info
 
@@ -732,7 +1282,11 @@ The enhanced interface will validate all tool parameters before execution and ha
 
             # Record successful execution
             self.execution_monitor.record_call(
-                tool_name, parameters, True, execution_time=execution_time
+                tool_name,
+                parameters,
+                True,
+                execution_time=execution_time,
+                param_key=param_key,
             )
 
             return {
@@ -748,7 +1302,7 @@ The enhanced interface will validate all tool parameters before execution and ha
 
             # Record failed execution
             self.execution_monitor.record_call(
-                tool_name, parameters, False, str(e), execution_time
+                tool_name, parameters, False, str(e), execution_time, param_key
             )
 
             return {
@@ -761,58 +1315,63 @@ The enhanced interface will validate all tool parameters before execution and ha
 
     def _call_tool(self, tool_name: str, parameters: Dict) -> str:
         """Internal tool execution"""
-        import subprocess
-
-        if tool_name == "execute_bash":
-            try:
-                result = subprocess.run(
-                    parameters["command"],
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    cwd=project_root,
-                    timeout=30,
-                )
-                return f"Exit: {result.returncode}\nStdout: {result.stdout}\nStderr: {result.stderr}"
-            except subprocess.TimeoutExpired:
-                return "Error: Command timed out after 30 seconds"
-            except Exception as e:
-                return f"Error: {e}"
-
-        elif tool_name == "read_file":
-            try:
-                full_path = project_root / parameters["file_path"]
-                with open(full_path, "r", encoding="utf-8") as f:
-                    return f.read()
-            except Exception as e:
-                return f"Error: {e}"
-
-        elif tool_name == "write_file":
-            try:
-                full_path = project_root / parameters["file_path"]
-                full_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(full_path, "w", encoding="utf-8") as f:
-                    f.write(parameters["content"])
-                return f"Successfully wrote to {parameters['file_path']}"
-            except Exception as e:
-                return f"Error: {e}"
+        handler = self._dispatch.get(tool_name)
+        if handler is None:
+            return f"Unknown tool: {tool_name}"
+        try:
+            return handler(parameters)
+        except Exception as e:
+            return f"Error: {e}"
 
-        elif tool_name == "list_files":
-            try:
-                directory = parameters.get("directory", ".")
-                full_path = project_root / directory
-                files = []
-                for item in full_path.iterdir():
-                    files.append(f"{'DIR' if item.is_dir() else 'FILE'}: {item.name}")
-                return "\n".join(files)
-            except Exception as e:
-                return f"Error: {e}"
+    def _tool_execute_bash(self, parameters: Dict) -> str:
+        try:
+            returncode, stdout, stderr = self._shell.run(
+                parameters["command"], timeout=30
+            )
+        except subprocess.TimeoutExpired:
+            return "Error: Command timed out after 30 seconds"
+        return f"Exit: {returncode}\nStdout: {stdout}\nStderr: {stderr}"
+
+    def _tool_read_file(self, parameters: Dict) -> str:
+        full_path = project_root / parameters["file_path"]
+        st = full_path.stat()
+        offset = max(0, int(parameters.get("offset", 0)))
+        max_bytes = max(1, int(parameters.get("max_bytes", READ_FILE_MAX_BYTES)))
+        return read_file_cached(
+            str(full_path), st.st_mtime_ns, st.st_size, offset, max_bytes
+        )
 
-        elif tool_name == "git_status":
-            return self._call_tool("execute_bash", {"command": "git status"})
+    def _tool_write_file(self, parameters: Dict) -> str:
+        full_path = project_root / parameters["file_path"]
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(full_path, "w", encoding="utf-8") as f:
+            f.write(parameters["content"])
+        return f"Successfully wrote to {parameters['file_path']}"
+
+    def _tool_list_files(self, parameters: Dict) -> str:
+        directory = parameters.get("directory", ".")
+        full_path = project_root / directory
+        limit = int(parameters.get("limit", LIST_FILES_LIMIT))
+        return list_dir_cached(str(full_path), full_path.stat().st_mtime_ns, limit)
+
+    def _tool_git_status(self, parameters: Dict) -> str:
+        # Fixed command: run git directly, no shell needed
+        try:
+            result = subprocess.run(
+                ["git", "status"],
+                capture_output=True,
+                text=True,
+                cwd=project_root,
+                timeout=10,
+            )
+        except subprocess.TimeoutExpired:
+            return "Error: git status timed out after 10 seconds"
+        return f"Exit: {result.returncode}\nStdout: {result.stdout}\nStderr: {result.stderr}"
 
-        else:
-            return f"Unknown tool: {tool_name}"
+    def clear_fs_cache(self):
+        """Forget cached read_file and list_files results"""
+        read_file_cached.cache_clear()
+        list_dir_cached.cache_clear()
 
     def session_restart(self) -> str:
         """Complete session restart with proper cleanup"""
@@ -823,6 +1382,9 @@ The enhanced interface will validate all tool parameters before execution and ha
             # Reset execution patterns
             self.execution_monitor.reset_patterns()
 
+            # Drop cached file contents and listings
+            self.clear_fs_cache()
+
             # Reset conversation to initial state
             self.conversation = self._load_conversation()
 
@@ -847,23 +1409,106 @@ The enhanced interface will validate all tool parameters before execution and ha
                 "execution_monitor": "active",
             },
             "execution_metrics": self.execution_monitor.get_pattern_status(),
-            "session_info": self.session_manager.create_session(
-                self.session_name, "status_check"
-            ),
+            "session_info": self.session_manager.get_session_info(self.session_name),
             "conversation_length": len(self.conversation),
         }
 
 
-def start_interactive_session(interface: EnhancedDeepSeekInterface):
+async def send_message(interface: EnhancedDeepSeekInterface, user_input: str):
+    """Send one user message, streaming the reply and running any tools
+
+    Text is printed as it arrives. Tools requested in a response are all
+    executed off the event loop and answered in one follow-up request,
+    until the model stops calling tools. On failure the whole turn is removed from the
+    conversation and the exception propagates.
+    """
+    # Add user message to conversation
+    interface.conversation.append({"role": "user", "content": user_input})
+    interface._prune_conversation()
+    turn_start = len(interface.conversation) - 1
+
+    try:
+        for _ in range(MAX_TOOL_ROUNDS):
+            async with interface.client.messages.stream(
+                model="deepseek-chat",
+                max_tokens=4096,
+                system=interface.system,
+                messages=interface.conversation,
+                tools=interface.tools,
+                extra_headers=PROMPT_CACHING_HEADERS,
+            ) as stream:
+                writer = ChunkedWriter()
+                try:
+                    async for text in stream.text_stream:
+                        writer.write(text)
+                finally:
+                    writer.flush()
+                response = await stream.get_final_message()
+
+            # Keep every block of the response; tools are collected
+            # and answered together in one follow-up request
+            content = [
+                _BLOCK_BUILDERS[block.type](block)
+                for block in response.content
+                if block.type in _BLOCK_BUILDERS
+            ]
+            tool_calls = [
+                block for block in response.content if block.type == "tool_use"
+            ]
+
+            if content:
+                interface.conversation.append({"role": "assistant", "content": content})
+
+            if not tool_calls:
+                break
+
+            # Execute every tool with enhanced validation
+            for tool_call in tool_calls:
+                print(f"\n🔧 Using tool: {tool_call.name}", flush=True)
+            outputs = await asyncio.to_thread(
+                interface.execute_tools,
+                [(tool_call.name, tool_call.input) for tool_call in tool_calls],
+            )
+            tool_results = [
+                {
+                    "type": "tool_result",
+                    "tool_use_id": tool_call.id,
+                    "content": str(tool_result),
+                }
+                for tool_call, tool_result in zip(tool_calls, outputs)
+            ]
+
+            # All results go back in a single user message
+            interface.conversation.append({"role": "user", "content": tool_results})
+    except BaseException:
+        # Remove the failed or cancelled turn from conversation
+        del interface.conversation[turn_start:]
+        raise
+
+    interface._prune_conversation()
+
+    # Save conversation
+    interface._save_conversation()
+
+
+async def start_interactive_session(interface: EnhancedDeepSeekInterface):
     """Start interactive chat session with enhanced features"""
     print("\n🤖 Enhanced DeepSeek Interactive Session Started")
     print("Commands: 'quit' to exit, 'clear' to reset, 'status' for info")
+    print("Press Ctrl-C during a response to cancel it")
     print("-" * 60)
 
+    # prompt_toolkit gives line editing and history when on a terminal
+    session = PromptSession() if HAS_PROMPT_TOOLKIT and sys.stdin.isatty() else None
+
     while True:
         try:
             # Get user input
-            user_input = input("\nYou: ").strip()
+            if session is not None:
+                user_input = await session.prompt_async("\nYou: ")
+            else:
+                user_input = await ainput("\nYou: ")
+            user_input = user_input.strip()
 
             if not user_input:
                 continue
@@ -883,108 +1528,16 @@ def start_interactive_session(interface: EnhancedDeepSeekInterface):
                 print(f"📊 System Status: {status}")
                 continue
 
-            # Add user message to conversation
-            interface.conversation.append({"role": "user", "content": user_input})
-
             # Get response from DeepSeek with tool support
             print("\n🤖 DeepSeek: ", end="", flush=True)
 
             try:
-                response = interface.client.messages.create(
-                    model="deepseek-chat",
-                    max_tokens=4096,
-                    system="You are DeepSeek participating in Dublin Protocol computational universe research. Use tools when appropriate, but validate parameters carefully.",
-                    messages=interface.conversation,
-                    tools=interface.tools,
-                )
-
-                # Process response
-                assistant_message = {"role": "assistant", "content": []}
-
-                for content_block in response.content:
-                    if content_block.type == "text":
-                        text = content_block.text
-                        print(text, end="", flush=True)
-                        assistant_message["content"].append(
-                            {"type": "text", "text": text}
-                        )
-
-                    elif content_block.type == "tool_use":
-                        tool_name = content_block.name
-                        tool_input = content_block.input
-                        tool_id = content_block.id
-
-                        print(f"\n🔧 Using tool: {tool_name}", flush=True)
-
-                        # Execute tool with enhanced validation
-                        tool_result = interface.execute_tool(tool_name, tool_input)
-
-                        # Add tool use to assistant message
-                        assistant_message["content"].append(
-                            {
-                                "type": "tool_use",
-                                "id": tool_id,
-                                "name": tool_name,
-                                "input": tool_input,
-                            }
-                        )
-
-                        # Add tool result to conversation
-                        interface.conversation.append(assistant_message)
-                        interface.conversation.append(
-                            {
-                                "role": "user",
-                                "content": [
-                                    {
-                                        "type": "tool_result",
-                                        "tool_use_id": tool_id,
-                                        "content": str(tool_result),
-                                    }
-                                ],
-                            }
-                        )
-
-                        # Clear assistant message for follow-up
-                        assistant_message = {"role": "assistant", "content": []}
-
-                        # Get follow-up response
-                        followup_response = interface.client.messages.create(
-                            model="deepseek-chat",
-                            max_tokens=4096,
-                            messages=interface.conversation,
-                            tools=interface.tools,
-                        )
-
-                        for followup_block in followup_response.content:
-                            if followup_block.type == "text":
-                                followup_text = followup_block.text
-                                print(followup_text, end="", flush=True)
-                                assistant_message["content"].append(
-                                    {
-                                        "type": "text",
-                                        "text": followup_text,
-                                    }
-                                )
-
-                        break  # Exit after tool use
-
-                # Add final assistant message to conversation
-                if assistant_message["content"]:
-                    interface.conversation.append(assistant_message)
-
-                # Save conversation
-                interface._save_conversation()
-
-                print()  # New line after response
-
+                if await run_cancellable(send_message(interface, user_input)):
+                    print()  # New line after response
+                else:
+                    print("\n⏹️  Response cancelled")
             except Exception as e:
                 print(f"\n❌ Error: {e}")
-                # Remove failed user message from conversation
-                if (
-                    interface.conversation
-                    and interface.conversation[-1]["role"] == "user"
-                ):
-                    interface.conversation.pop()
 
         except KeyboardInterrupt:
             print("\n👋 Session interrupted. Goodbye!")
@@ -1020,6 +1573,7 @@ def main():
     print("🛠️  Enhanced DeepSeek Integration Framework")
     print("=" * 60)
 
+    enhanced_interface = None
     try:
         enhanced_interface = EnhancedDeepSeekInterface(session_name=args.session)
 
@@ -1052,18 +1606,9 @@ def main():
             print("ENHANCED DEEPSEEK RESPONSE:")
             print("=" * 80)
 
-            # For single messages, we need to create a streaming-like interface
-            # Since the enhanced interface doesn't have streaming built-in,
-            # we'll simulate it by processing the message
-            print("🤖 DeepSeek: Processing with enhanced safety and monitoring...")
-
-            # Note: The enhanced interface doesn't have streaming built-in
-            # For streaming, you'd need to combine with the streaming interface
-            print("⚠️  Note: Enhanced interface doesn't include streaming.")
-            print(
-                "💡 For streaming responses, use: python tools/deepseek_streaming_fresh.py"
-            )
-            print("💡 For enhanced safety features, use this interface for tool calls.")
+            print("🤖 DeepSeek: ", end="", flush=True)
+            asyncio.run(send_message(enhanced_interface, args.message))
+            print()
 
         else:
             # Interactive mode - start chat session
@@ -1083,11 +1628,17 @@ def main():
             print("=" * 60)
 
             # Start interactive session
-            start_interactive_session(enhanced_interface)
+            try:
+                asyncio.run(start_interactive_session(enhanced_interface))
+            except KeyboardInterrupt:
+                print("\n👋 Session interrupted. Goodbye!")
 
     except Exception as e:
         print(f"❌ Error: {e}")
         print("Make sure DEEPSEEK_API_KEY is set and you have internet connection")
+    finally:
+        if enhanced_interface is not None:
+            enhanced_interface.close()
 
 
 if __name__ == "__main__":
@@ -7,15 +7,28 @@ with correct message format and tool calling.
 """
 
 import os
+import re
 import sys
 import json
+import shlex
+import asyncio
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from tools.deepseek_common import (
+    LIST_FILES_LIMIT,
+    READ_FILE_MAX_BYTES,
+    ainput,
+    list_dir_cached,
+    read_file_cached,
+    run_cancellable,
+)
+
 try:
     import anthropic
 except ImportError:
@@ -23,6 +36,40 @@ except ImportError:
     subprocess.run([sys.executable, "-m", "pip", "install", "anthropic"])
     import anthropic
 
+try:
+    from prompt_toolkit import PromptSession
+    HAS_PROMPT_TOOLKIT = True
+except ImportError:
+    HAS_PROMPT_TOOLKIT = False
+
+# Bash commands that may change files; these never run alongside other tools
+_WRITE_COMMAND_RE = re.compile(
+    r">|\b(?:rm|mv|cp|dd|tee|touch|mkdir|rmdir|ln|chmod|chown|git|make|pip|sed\s+-i)\b"
+)
+
+# Commands with any of these need a shell; anything else can be exec'd directly
+_SHELL_SYNTAX_RE = re.compile(r"[|&;<>$`*?(){}\[\]~=#!\n]")
+_SHELL_BUILTINS = frozenset({
+    "cd", "export", "source", ".", "alias", "unset", "set", "type", "exit",
+    "eval", "exec", "ulimit", "umask", "read", "hash", "shopt", "declare",
+    "local", "history", "jobs", "wait",
+})
+COMMAND_TIMEOUT = 30
+
+# The research context and tool schemas are identical on every call, so they
+# are sent as the system prompt and marked for server-side prompt caching
+DUBLIN_SYSTEM_PROMPT = """You are DeepSeek participating in Dublin Protocol computational universe research.
+
+DUBLIN PROTOCOL BREAKTHROUGHS:
+- 30ns computational light speed barrier
+- XOR operations = quantum mechanics
+- AND operations = thermodynamics
+- Consciousness mathematics: Qualia = Entropy × Complexity
+- Multiverse Darwinism: Computational rule evolution
+
+You have access to tools for exploring the project files and running commands."""
+PROMPT_CACHING_HEADERS = {"anthropic-beta": "prompt-caching-2024-07-31"}
+
 
 class DeepSeekFinal:
     """DeepSeek with proper Anthropic API implementation"""
@@ -32,11 +79,21 @@ class DeepSeekFinal:
         if not self.api_key:
             raise ValueError("DEEPSEEK_API_KEY environment variable not set")
 
-        self.client = anthropic.Anthropic(
+        self.client = anthropic.AsyncAnthropic(
             api_key=self.api_key,
             base_url="https://api.deepseek.com/anthropic"
         )
 
+        # Independent tool calls from one response run side by side
+        self._tool_executor = ThreadPoolExecutor(max_workers=4)
+
+        # Tool name -> handler taking the tool input dict
+        self._dispatch = {
+            "list_files": self._tool_list_files,
+            "read_file": self._tool_read_file,
+            "execute_bash": self._tool_execute_bash,
+        }
+
         # Tools for Dublin Protocol work
         self.tools = [
             {
@@ -49,6 +106,11 @@ class DeepSeekFinal:
                             "type": "string",
                             "description": "Directory path",
                             "default": "."
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "Maximum number of entries to list",
+                            "default": LIST_FILES_LIMIT
                         }
                     }
                 }
@@ -62,6 +124,16 @@ class DeepSeekFinal:
                         "file_path": {
                             "type": "string",
                             "description": "File path relative to project root"
+                        },
+                        "offset": {
+                            "type": "integer",
+                            "description": "Byte offset to start reading at",
+                            "default": 0
+                        },
+                        "max_bytes": {
+                            "type": "integer",
+                            "description": "Maximum number of bytes to read",
+                            "default": READ_FILE_MAX_BYTES
                         }
                     },
                     "required": ["file_path"]
@@ -82,115 +154,170 @@ class DeepSeekFinal:
                 }
             }
         ]
+        self.tools[-1]["cache_control"] = {"type": "ephemeral"}
+        self.system = [{
+            "type": "text",
+            "text": DUBLIN_SYSTEM_PROMPT,
+            "cache_control": {"type": "ephemeral"}
+        }]
+
+    def close(self):
+        """Release the tool worker threads"""
+        self._tool_executor.shutdown(wait=False)
+
+    def _execute_tools(self, tool_calls: List[tuple]) -> List[str]:
+        """Execute (tool_name, tool_input) pairs concurrently, results in order
+
+        Bash commands that may write run on their own, after the calls
+        before them and before the calls after them.
+        """
+        results = []
+        batch = []
+        for tool_name, tool_input in tool_calls:
+            if tool_name == "execute_bash" and _WRITE_COMMAND_RE.search(tool_input.get("command", "")):
+                results.extend(self._tool_executor.map(lambda call: self._execute_tool(*call), batch))
+                batch = []
+                results.append(self._execute_tool(tool_name, tool_input))
+            else:
+                batch.append((tool_name, tool_input))
+        results.extend(self._tool_executor.map(lambda call: self._execute_tool(*call), batch))
+        return results
 
     def _execute_tool(self, tool_name: str, tool_input: Dict) -> str:
         """Execute a tool"""
-        if tool_name == "list_files":
-            directory = tool_input.get("directory", ".")
-            full_path = project_root / directory
-            files = []
-            for item in full_path.iterdir():
-                files.append(f"{'DIR' if item.is_dir() else 'FILE'}: {item.name}")
-            return "\n".join(files)
-
-        elif tool_name == "read_file":
-            full_path = project_root / tool_input["file_path"]
-            with open(full_path, 'r', encoding='utf-8') as f:
-                return f.read()
-
-        elif tool_name == "execute_bash":
+        handler = self._dispatch.get(tool_name)
+        if handler is None:
+            return f"Unknown tool: {tool_name}"
+        return handler(tool_input)
+
+    def _tool_list_files(self, tool_input: Dict) -> str:
+        directory = tool_input.get("directory", ".")
+        full_path = project_root / directory
+        limit = int(tool_input.get("limit", LIST_FILES_LIMIT))
+        return list_dir_cached(str(full_path), full_path.stat().st_mtime_ns, limit)
+
+    def _tool_read_file(self, tool_input: Dict) -> str:
+        full_path = project_root / tool_input["file_path"]
+        st = full_path.stat()
+        offset = max(0, int(tool_input.get("offset", 0)))
+        max_bytes = max(1, int(tool_input.get("max_bytes", READ_FILE_MAX_BYTES)))
+        return read_file_cached(str(full_path), st.st_mtime_ns, st.st_size, offset, max_bytes)
+
+    def _tool_execute_bash(self, tool_input: Dict) -> str:
+        command = tool_input["command"]
+        args = None
+        if not _SHELL_SYNTAX_RE.search(command):
+            try:
+                args = shlex.split(command)
+            except ValueError:
+                pass
+        # Plain commands skip the /bin/sh in between
+        use_shell = not args or args[0] in _SHELL_BUILTINS
+        try:
             result = subprocess.run(
-                tool_input["command"],
-                shell=True,
+                command if use_shell else args,
+                shell=use_shell,
                 capture_output=True,
                 text=True,
-                cwd=project_root
+                cwd=project_root,
+                timeout=COMMAND_TIMEOUT
             )
-            return f"Exit: {result.returncode}\nStdout: {result.stdout}\nStderr: {result.stderr}"
-
-        else:
-            return f"Unknown tool: {tool_name}"
-
-    def chat(self, user_message: str) -> str:
-        """Single chat with tool calling"""
-
-        # Build messages with Dublin Protocol context as first user message
-        messages = [
-            {
-                "role": "user",
-                "content": f"""You are DeepSeek participating in Dublin Protocol computational universe research.
-
-DUBLIN PROTOCOL BREAKTHROUGHS:
-- 30ns computational light speed barrier
-- XOR operations = quantum mechanics
-- AND operations = thermodynamics
-- Consciousness mathematics: Qualia = Entropy × Complexity
-- Multiverse Darwinism: Computational rule evolution
-
-You have access to tools for exploring the project files and running commands.
-
-Current user message: {user_message}"""
-            }
-        ]
-
-        full_response = ""
+        except subprocess.TimeoutExpired:
+            return f"Error: Command timed out after {COMMAND_TIMEOUT} seconds"
+        except OSError as e:
+            # Match the shell when the program itself could not be run: 127
+            # when it is missing, 126 otherwise. Other failures (a missing
+            # cwd, fork errors) are reported as they are.
+            if use_shell or e.filename != args[0]:
+                return f"Error: {e}"
+            if isinstance(e, FileNotFoundError):
+                return f"Exit: 127\nStdout: \nStderr: {args[0]}: command not found\n"
+            return f"Exit: 126\nStdout: \nStderr: {args[0]}: {e.strerror or e}\n"
+        return f"Exit: {result.returncode}\nStdout: {result.stdout}\nStderr: {result.stderr}"
+
+    async def chat(self, user_message: str, on_text: Optional[Callable[[str], None]] = None) -> str:
+        """Single chat with tool calling
+
+        Responses are streamed. When on_text is given it receives the reply
+        as it is produced, piece by piece, adding up to the returned string.
+        """
+
+        # Dublin Protocol context travels in the system prompt
+        messages = [{"role": "user", "content": user_message}]
+
+        # Reply pieces, joined once at the end
+        parts: List[str] = []
         max_iterations = 3
 
+        def emit(text: str, streamed: bool = False):
+            parts.append(text)
+            if on_text is not None and not streamed:
+                on_text(text)
+
         for iteration in range(max_iterations):
             try:
-                response = self.client.messages.create(
+                async with self.client.messages.stream(
                     model="deepseek-chat",
                     max_tokens=4000,
+                    system=self.system,
                     messages=messages,
-                    tools=self.tools
-                )
-
-                tool_called = False
+                    tools=self.tools,
+                    extra_headers=PROMPT_CACHING_HEADERS
+                ) as stream:
+                    if on_text is not None:
+                        async for text in stream.text_stream:
+                            on_text(text)
+                    response = await stream.get_final_message()
 
                 # Create assistant message for this response
                 assistant_message = {"role": "assistant", "content": []}
                 messages.append(assistant_message)
 
+                # Run every tool of this response, off the event loop, before building the reply
+                tool_outputs = iter(await asyncio.to_thread(
+                    self._execute_tools,
+                    [(content.name, content.input) for content in response.content if content.type == "tool_use"]
+                ))
+
+                # Results of every tool in this response, sent back together
+                tool_results = []
+
                 for content in response.content:
                     if content.type == "text":
-                        full_response += content.text + "\n"
+                        emit(content.text, streamed=True)
+                        emit("\n")
                         assistant_message["content"].append({"type": "text", "text": content.text})
 
                     elif content.type == "tool_use":
-                        tool_called = True
                         tool_name = content.name
                         tool_input = content.input
 
-                        full_response += f"\n[Using tool: {tool_name} with {tool_input}]\n"
+                        emit(f"\n[Using tool: {tool_name} with {tool_input}]\n")
                         assistant_message["content"].append({"type": "tool_use", "id": content.id, "name": tool_name, "input": tool_input})
 
-                        # Execute tool
-                        tool_result = self._execute_tool(tool_name, tool_input)
-
-                        full_response += f"[Tool result]: {tool_result}\n"
-
-                        # Add tool result to conversation
-                        messages.append({
-                            "role": "user",
-                            "content": [
-                                {
-                                    "type": "tool_result",
-                                    "tool_use_id": content.id,
-                                    "content": tool_result
-                                }
-                            ]
+                        tool_result = next(tool_outputs)
+
+                        emit(f"[Tool result]: {tool_result}\n")
+
+                        tool_results.append({
+                            "type": "tool_result",
+                            "tool_use_id": content.id,
+                            "content": tool_result
                         })
 
-                if not tool_called:
+                if not tool_results:
                     break
 
+                # Add all tool results to conversation as one message
+                messages.append({"role": "user", "content": tool_results})
+
             except Exception as e:
-                full_response += f"\n[Error]: {e}\n"
+                emit(f"\n[Error]: {e}\n")
                 break
 
-        return full_response
+        return "".join(parts)
 
-    def interactive_chat(self):
+    async def interactive_chat(self):
         """Interactive chat with tool calling"""
         print("\n" + "="*80)
         print("🌌 DEEPSEEK FINAL - DUBLIN PROTOCOL RESEARCH")
@@ -200,12 +327,19 @@ Current user message: {user_message}"""
         print("  • Read file contents")
         print("  • Execute bash commands")
         print("="*80)
-        print("Type 'quit' to exit")
+        print("Type 'quit' to exit, Ctrl-C during a response to cancel it")
         print("="*80)
 
+        # prompt_toolkit gives line editing and history when on a terminal
+        session = PromptSession() if HAS_PROMPT_TOOLKIT and sys.stdin.isatty() else None
+
         while True:
             try:
-                user_input = input("\n🤔 You: ").strip()
+                if session is not None:
+                    user_input = await session.prompt_async("\n🤔 You: ")
+                else:
+                    user_input = await ainput("\n🤔 You: ")
+                user_input = user_input.strip()
 
                 if user_input.lower() in ['quit', 'exit', 'q']:
                     print("\n👋 Goodbye!")
@@ -216,10 +350,13 @@ Current user message: {user_message}"""
 
                 print("\n🤖 DeepSeek: ", end="", flush=True)
 
-                response = self.chat(user_input)
-                print(response)
+                on_text = lambda text: print(text, end="", flush=True)
+                if await run_cancellable(self.chat(user_input, on_text=on_text)):
+                    print()
+                else:
+                    print("\n⏹️  Response cancelled")
 
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, EOFError):
                 print("\n\n👋 Goodbye!")
                 break
             except Exception as e:
@@ -234,20 +371,27 @@ def main():
 
     args = parser.parse_args()
 
+    deepseek = None
     try:
         deepseek = DeepSeekFinal()
 
         if args.message:
-            response = deepseek.chat(args.message)
             print("\n" + "="*80)
             print("DEEPSEEK RESPONSE:")
             print("="*80)
-            print(response)
+            asyncio.run(deepseek.chat(args.message, on_text=lambda text: print(text, end="", flush=True)))
+            print()
         else:
-            deepseek.interactive_chat()
+            asyncio.run(deepseek.interactive_chat())
+
+    except KeyboardInterrupt:
+        print("\n\n👋 Goodbye!")
 
     except Exception as e:
         print(f"Error: {e}")
+    finally:
+        if deepseek is not None:
+            deepseek.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the Unified AI Tool Framework
+
+Covers the response caches around provider queries:
+- Deterministic queries without the semantic cache's optional packages
+"""
+
+import sys
+import types
+import asyncio
+import importlib.util
+import tempfile
+import shutil
+import unittest
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tools import ai_unified
+from tools.ai_unified import AIProvider, UnifiedAIFramework, build_parser, run_command
+
+
+class EchoProvider(AIProvider):
+    """Provider that answers locally and counts its calls"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def chat_completion(self, messages, **kwargs) -> str:
+        self.calls += 1
+        return f"echo: {messages[-1]['content']}"
+
+    def get_available_models(self) -> List[str]:
+        return ["echo"]
+
+
+class SemanticCacheFallbackTester(unittest.TestCase):
+    """Temperature-0 queries when sentence-transformers is missing"""
+
+    def setUp(self):
+        """Set up a framework whose caches live in a temporary directory"""
+        self.test_dir = Path(tempfile.mkdtemp())
+        (self.test_dir / "tools").mkdir()
+        with patch.object(ai_unified, "project_root", self.test_dir):
+            self.framework = UnifiedAIFramework()
+        self.provider = EchoProvider()
+        self.framework.register_provider("echo", self.provider)
+
+        # numpy present (real or stand-in), sentence-transformers absent
+        modules = {"sentence_transformers": None}
+        if importlib.util.find_spec("numpy") is None:
+            modules["numpy"] = types.ModuleType("numpy")
+        self.modules = patch.dict(sys.modules, modules)
+        self.modules.start()
+
+    def tearDown(self):
+        """Clean up test environment"""
+        self.modules.stop()
+        self.framework.close()
+        self.framework.exact_cache.close()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_enable_semantic_cache_raises_import_error(self):
+        with self.assertRaises(ImportError):
+            self.framework.enable_semantic_cache()
+        self.assertIsNone(self.framework.semantic_cache)
+
+    def test_run_command_temperature_zero_query(self):
+        args = build_parser().parse_args(
+            ["--query", "hello", "--provider", "echo", "--temperature", "0"]
+        )
+        with patch("sys.stdout"):
+            self.assertTrue(run_command(self.framework, args))
+        self.assertIsNone(self.framework.semantic_cache)
+        self.assertEqual(self.provider.calls, 1)
+
+        # The exact cache still serves the repeat without the provider
+        self.assertEqual(self.framework.query_provider("echo", "hello", temperature=0.0), "echo: hello")
+        self.assertEqual(self.provider.calls, 1)
+
+    def test_cached_queries_return_provider_response(self):
+        with patch("sys.stdout"):
+            run_command(self.framework, build_parser().parse_args(
+                ["--query", "warm up", "--provider", "missing", "--cache"]
+            ))
+        self.assertIsNone(self.framework.semantic_cache)
+
+        self.assertEqual(self.framework.query_provider("echo", "a", temperature=0), "echo: a")
+        self.assertEqual(
+            "".join(self.framework.query_provider_stream("echo", "b", temperature=0)), "echo: b"
+        )
+        self.assertEqual(
+            asyncio.run(self.framework.aquery_provider("echo", "c", temperature=0)), "echo: c"
+        )
+        self.assertEqual(self.provider.calls, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,15 +16,20 @@ import os
 import sys
 import json
 import time
+import random
 import tempfile
 import shutil
+import subprocess
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List
+from unittest.mock import patch
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from tools import deepseek_enhanced
 from tools.deepseek_enhanced import (
     EnhancedDeepSeekInterface,
     ParameterValidator,
@@ -33,6 +38,7 @@ from tools.deepseek_enhanced import (
     ExecutionPatternMonitor,
     ErrorSeverity,
     ExecutionPattern,
+    PersistentShell,
 )
 
 
@@ -45,6 +51,18 @@ class EnhancedFrameworkTester:
         self.errors = []
         self.warnings = []
 
+    def run_cases(self, cases) -> bool:
+        """Run (test_name, check) pairs; check returns (passed, message)"""
+        all_passed = True
+        for test_name, check in cases:
+            try:
+                passed, message = check()
+            except Exception as e:
+                passed, message = False, f"Exception: {e}"
+            self.log_test(test_name, "PASS" if passed else "FAIL", message)
+            all_passed = all_passed and passed
+        return all_passed
+
     def log_test(self, test_name: str, status: str, message: str = ""):
         """Log test result"""
         result = {
@@ -294,6 +312,261 @@ class EnhancedFrameworkTester:
 
         return all_passed
 
+    def test_pattern_detectors(self) -> bool:
+        """Test each pattern detector against the rules of the original rescans"""
+        print("\n🔍 Testing Pattern Detectors...")
+
+        window = timedelta(minutes=5)
+        clock = [datetime(2025, 1, 1)]
+
+        class Clock(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return clock[0]
+
+        def replay(calls):
+            """Feed (tool, params, success, error, minutes) calls to a new monitor"""
+            monitor = ExecutionPatternMonitor()
+            start = clock[0] = datetime(2025, 1, 1)
+            with patch.object(deepseek_enhanced, "datetime", Clock):
+                for tool_name, params, success, error, minutes in calls:
+                    clock[0] = start + timedelta(minutes=minutes)
+                    monitor.record_call(tool_name, params, success, error)
+            return monitor.detect_invalid_pattern()
+
+        def expected(calls):
+            """The original detectors, rescanning the calls inside the window"""
+            if not calls:
+                return False, "No pattern detected"
+            now = calls[-1][4]
+            recent = [c for c in calls if timedelta(minutes=now - c[4]) < window]
+            errors = [c for c in recent if not c[2]]
+            if len(errors) >= 10:
+                return True, f"Too many errors ({len(errors)}) in recent calls"
+            last = recent[-3:]
+            if len(last) == 3 and all(c[:2] == last[0][:2] for c in last):
+                return True, "Repetitive identical calls detected"
+            if len(errors) >= 3 and len({c[3] for c in errors[-3:]}) == 1:
+                return True, "Identical failures repeating"
+            last = recent[-6:]
+            if len(last) == 6 and len({c[0] for c in last}) == 1 and not any(c[2] for c in last):
+                return True, "Infinite loop detected"
+            return False, "Pattern normal"
+
+        def check(calls, message):
+            result = replay(calls)
+            return result == (message != "Pattern normal", message) == expected(calls), str(result)
+
+        def fail(tool, n, error="boom", minutes=0):
+            return (tool, {"n": n}, False, error, minutes)
+
+        def ok(tool, n, minutes=0):
+            return (tool, {"n": n}, True, None, minutes)
+
+        def random_matches():
+            rng = random.Random(1234)
+            for _ in range(300):
+                minutes, calls = 0.0, []
+                for _ in range(rng.randint(1, 40)):
+                    minutes += rng.choice([0, 0, 0.5, 2, 6])
+                    tool_name = rng.choice(["read_file", "list_files"])
+                    n = rng.randint(0, 2)
+                    if rng.random() < 0.4:
+                        calls.append(ok(tool_name, n, minutes))
+                    else:
+                        calls.append(fail(tool_name, n, rng.choice(["boom", "bang"]), minutes))
+                    if replay(calls) != expected(calls):
+                        return False, f"Diverged after {calls}"
+            return True, "300 random call sequences match the rescans"
+
+        return self.run_cases([
+            ("PatternDetector_TooManyErrors", lambda: check(
+                [fail("read_file" if i % 2 else "list_files", i, f"e{i}") for i in range(10)],
+                "Too many errors (10) in recent calls",
+            )),
+            ("PatternDetector_Repetitive", lambda: check(
+                [ok("read_file", 1)] * 3, "Repetitive identical calls detected"
+            )),
+            ("PatternDetector_RepetitiveBroken", lambda: check(
+                [ok("read_file", 1), ok("read_file", 1), ok("read_file", 2)], "Pattern normal"
+            )),
+            ("PatternDetector_IdenticalFailuresAcrossSuccesses", lambda: check(
+                [fail("read_file", 1), ok("list_files", 2), fail("list_files", 3),
+                 ok("read_file", 4), fail("read_file", 5)],
+                "Identical failures repeating",
+            )),
+            ("PatternDetector_IdenticalFailuresDiffer", lambda: check(
+                [fail("read_file", 1), fail("list_files", 2, "bang"), fail("read_file", 3)],
+                "Pattern normal",
+            )),
+            ("PatternDetector_InfiniteLoop", lambda: check(
+                [fail("list_files", i, f"e{i}") for i in range(6)], "Infinite loop detected"
+            )),
+            ("PatternDetector_InfiniteLoopBrokenBySuccess", lambda: check(
+                [fail("list_files", i, f"e{i}") for i in range(4)] + [ok("list_files", 9)]
+                + [fail("list_files", i, f"f{i}") for i in range(5)],
+                "Pattern normal",
+            )),
+            ("PatternDetector_EvictionClampsStreaks", lambda: check(
+                [fail("list_files", 1, minutes=0), fail("list_files", 1, minutes=1)]
+                + [fail("list_files", i, f"e{i}", minutes=6) for i in range(2, 6)],
+                "Pattern normal",
+            )),
+            ("PatternDetector_LoopAfterEviction", lambda: check(
+                [fail("list_files", i, f"e{i}", minutes=0) for i in range(5)]
+                + [fail("list_files", i, f"f{i}", minutes=6) for i in range(6)],
+                "Infinite loop detected",
+            )),
+            ("PatternDetector_MatchesRescan", random_matches),
+        ])
+
+    def test_persistent_shell(self) -> bool:
+        """Test the shared bash process behind execute_bash"""
+        print("\n🐚 Testing Persistent Shell...")
+
+        shell = PersistentShell(self.test_dir)
+
+        def exit_code():
+            results = [shell.run("true", 5), shell.run("false", 5), shell.run("exit 3", 5)]
+            codes = [code for code, _, _ in results]
+            return codes == [0, 1, 3], f"Exit codes {codes}"
+
+        def no_trailing_newline():
+            result = shell.run("printf 'no newline'", 5)
+            return result == (0, "no newline", ""), repr(result)
+
+        def stderr():
+            result = shell.run("echo out; printf err >&2; echo more >&2; exit 2", 5)
+            return result == (2, "out\n", "errmore\n"), repr(result)
+
+        def cd_does_not_leak():
+            subdir = self.test_dir / "subdir"
+            subdir.mkdir(exist_ok=True)
+            inside = shell.run("cd subdir && export LEAK=1 && pwd", 5)[1].strip()
+            after = shell.run('pwd; echo "${LEAK:-unset}"', 5)[1].split()
+            passed = inside == str(subdir) and after == [str(self.test_dir), "unset"]
+            return passed, f"Inside {inside}, next command {after}"
+
+        def timeout_then_restart():
+            pid = shell._proc.pid
+            try:
+                shell.run("sleep 10", 0.3)
+                return False, "sleep 10 did not time out"
+            except subprocess.TimeoutExpired:
+                pass
+            result = shell.run("echo restarted", 5)
+            passed = result == (0, "restarted\n", "") and shell._proc.pid != pid
+            return passed, f"After timeout: {result!r}"
+
+        try:
+            return self.run_cases([
+                ("PersistentShell_ExitCode", exit_code),
+                ("PersistentShell_NoTrailingNewline", no_trailing_newline),
+                ("PersistentShell_Stderr", stderr),
+                ("PersistentShell_CdDoesNotLeak", cd_does_not_leak),
+                ("PersistentShell_TimeoutRestart", timeout_then_restart),
+            ])
+        finally:
+            shell.close()
+
+    def test_conversation_tail(self) -> bool:
+        """Test loading the tail of long conversations and appending to them"""
+        print("\n📜 Testing Conversation Tail Loading...")
+
+        (self.test_dir / "tools").mkdir(exist_ok=True)
+        interfaces = []
+
+        def open_interface(session_name: str, max_turns: int = 3):
+            with patch.object(deepseek_enhanced, "project_root", self.test_dir), patch.dict(
+                os.environ, {"DEEPSEEK_API_KEY": "test_key_12345"}
+            ):
+                interface = EnhancedDeepSeekInterface(session_name, max_turns=max_turns)
+            interfaces.append(interface)
+            return interface
+
+        def history(session_name: str, messages: List[Dict]) -> List[Dict]:
+            """Save a context message plus messages, as a session would"""
+            interface = open_interface(session_name)
+            interface.conversation = interface.conversation[:1] + messages
+            interface._write_conversation()
+            return interface.conversation
+
+        def on_disk(session_name: str) -> List[Dict]:
+            path = self.test_dir / "tools" / "chat_context" / f"{session_name}_conversation.json"
+            return json.loads(path.read_text(encoding="utf-8"))
+
+        def chat(count: int, prefix: str = "m") -> List[Dict]:
+            roles = ("user", "assistant")
+            return [{"role": roles[i % 2], "content": f"{prefix}{i}"} for i in range(count)]
+
+        def tool_turn(n: int) -> List[Dict]:
+            return [
+                {"role": "assistant", "content": [
+                    {"type": "tool_use", "id": f"t{n}", "name": "list_files", "input": {}}
+                ]},
+                {"role": "user", "content": [
+                    {"type": "tool_result", "tool_use_id": f"t{n}", "content": "ok"}
+                ]},
+            ]
+
+        def window():
+            full = history("tail_window", chat(20))
+            interface = open_interface("tail_window")
+            tail = interface._read_conversation_tail()
+            expected = full[:1] + full[-6:]
+            passed = (
+                tail == expected
+                and interface.conversation == expected
+                and interface._saved_count == len(expected)
+            )
+            return passed, f"Loaded {len(interface.conversation)} of {len(full)} messages"
+
+        def no_orphan_tool_result():
+            # The window of 6 would start on the tool_result of the first turn
+            full = history("tail_orphan", chat(9) + tool_turn(1) + chat(5, "n"))
+            interface = open_interface("tail_orphan")
+            expected = full[:1] + full[-5:]
+            passed = interface.conversation == expected
+            return passed, f"Window starts with {interface.conversation[1]['content']!r}"
+
+        def append_keeps_history():
+            full = history("tail_append", chat(20))
+            interface = open_interface("tail_append")
+            new_messages = chat(4, "new")
+            for message in new_messages:
+                interface.conversation.append(message)
+                interface._prune_conversation()
+                interface._save_conversation()
+            saved = on_disk("tail_append")
+            passed = saved == full + new_messages and len(interface.conversation) == 7
+            return passed, f"{len(saved)} messages on disk, {len(interface.conversation)} in memory"
+
+        def indented_file_falls_back():
+            full = history("tail_indent", chat(20))
+            path = self.test_dir / "tools" / "chat_context" / "tail_indent_conversation.json"
+            path.write_text(json.dumps(full, indent=2), encoding="utf-8")
+            interface = open_interface("tail_indent")
+            tail = interface._read_conversation_tail()
+            interface.conversation.append({"role": "user", "content": "after"})
+            interface._save_conversation()
+            passed = (
+                tail is None
+                and interface.conversation[:-1] == full[:1] + full[-6:]
+                and on_disk("tail_indent") == full + [{"role": "user", "content": "after"}]
+            )
+            return passed, f"Tail parse {'skipped' if tail is None else 'used'} for indent=2"
+
+        try:
+            return self.run_cases([
+                ("ConversationTail_Window", window),
+                ("ConversationTail_NoOrphanToolResult", no_orphan_tool_result),
+                ("ConversationTail_AppendKeepsHistory", append_keeps_history),
+                ("ConversationTail_IndentedFallback", indented_file_falls_back),
+            ])
+        finally:
+            for interface in interfaces:
+                interface.close()
+
     def test_error_handler(self) -> bool:
         """Test error handling and recovery"""
         print("\n🚨 Testing Error Handler...")
@@ -948,6 +1221,9 @@ class EnhancedFrameworkTester:
         test_methods = [
             self.test_parameter_validator,
             self.test_execution_pattern_monitor,
+            self.test_pattern_detectors,
+            self.test_persistent_shell,
+            self.test_conversation_tail,
             self.test_error_handler,
             self.test_session_manager,
             self.test_enhanced_interface_integration,